@@ -15,8 +15,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.api.db.database import get_db
+from app.api.utils import redis_client
+from app.api.utils.api_key_utils import hash_api_key
+from app.api.utils.clock import now
 from app.api.utils.exceptions import (
-    UserNotFoundException,
     MissingAuthorizationException,
     InsufficientPermissionsException
 )
@@ -24,6 +26,9 @@ from app.api.utils.exceptions import (
 logger = logging.getLogger(__name__)
 security = HTTPBearer(auto_error=False)
 
+# Upper bound on how long a verified API key stays cached
+_API_KEY_CACHE_TTL = 300
+
 
 class AuthContext:
     """
@@ -124,44 +129,75 @@ class APIKeyHandler:
     """
 
     @staticmethod
-    async def verify_api_key(key: str, session: AsyncSession) -> tuple[str, list[str]]:
+    async def verify_api_key(key: str, session: AsyncSession) -> tuple[UUID, str, list[str]]:
         """
-        Verify an API key and return user_id and permissions.
-        
+        Verify an API key and return user_id, email and permissions.
+
+        Valid keys are cached in Redis by hash until they expire (at most
+        five minutes), and unknown keys are cached as misses for a minute,
+        so repeated requests skip the database.
+
         Args:
             key (str): API key to verify
             session (AsyncSession): Database session
             
         Returns:
-            tuple: (user_id, permissions)
+            tuple: (user_id, email, permissions)
             
         Raises:
             HTTPException: If key is invalid, expired, or revoked
 
         """
         from app.api.v1.models.api_key import APIKey
+        from app.api.v1.models.user import User
         from app.api.utils.exceptions import InvalidAPIKeyException
 
+        key_hash = hash_api_key(key)
+        cached = await redis_client.get_cached_api_key(key_hash)
+        if cached is not None:
+            if not cached:
+                raise InvalidAPIKeyException("API key not found")
+            return UUID(cached["user_id"]), cached["email"], cached["permissions"]
+
         try:
-            statement = select(APIKey).where(APIKey.key == key)
+            statement = (
+                select(APIKey, User.email)
+                .join(User, User.id == APIKey.user_id)
+                .where(APIKey.key == key)
+            )
             result = await session.execute(statement)
-            api_key = result.scalar_one_or_none()
+            row = result.first()
 
-            if not api_key:
-                logger.warning(f"API key not found: {key[:10]}...")
+            if not row:
+                logger.warning("API key not found: %s...", key[:10])
+                await redis_client.cache_api_key_miss(key_hash)
                 raise InvalidAPIKeyException("API key not found")
 
+            api_key, email = row
+
             if not api_key.is_valid():
-                logger.warning(f"API key invalid/expired: {key[:10]}...")
+                logger.warning("API key invalid/expired: %s...", key[:10])
                 raise InvalidAPIKeyException("API key is expired or revoked")
 
-            logger.debug(f"API key verified for user: {api_key.user_id}")
-            return str(api_key.user_id), api_key.permissions or []
+            permissions = api_key.permissions or []
+            ttl = min(
+                _API_KEY_CACHE_TTL,
+                int((api_key.expires_at - now()).total_seconds())
+            )
+            if ttl > 0:
+                await redis_client.cache_api_key(
+                    key_hash,
+                    {"user_id": str(api_key.user_id), "email": email, "permissions": permissions},
+                    ttl,
+                )
+
+            logger.debug("API key verified for user: %s", api_key.user_id)
+            return api_key.user_id, email, permissions
 
         except InvalidAPIKeyException:
             raise
         except Exception as e:
-            logger.error(f"API key verification failed: {str(e)}", exc_info=True)
+            logger.error("API key verification failed: %s", e, exc_info=True)
             raise InvalidAPIKeyException("Invalid API key")
 
 
@@ -192,22 +228,17 @@ async def get_auth_context(
         token = credentials.credentials
         payload = await JWTHandler.verify_token(token)
         return AuthContext(
-            user_id=payload["sub"],
+            user_id=UUID(payload["sub"]),
             email=payload["email"],
             auth_type="jwt",
         )
 
     if api_key_header:
-        user_id, permissions = await APIKeyHandler.verify_api_key(api_key_header, session)
-
-        from app.api.v1.models.user import User
-        user = await session.get(User, user_id)
-        if not user:
-            raise UserNotFoundException(f"User not found for ID: {user_id}")
+        user_id, email, permissions = await APIKeyHandler.verify_api_key(api_key_header, session)
 
         return AuthContext(
-            user_id=UUID(user_id),
-            email=user.email,
+            user_id=user_id,
+            email=email,
             auth_type="api_key",
             permissions=permissions,
         )
@@ -242,7 +273,7 @@ def require_permission(permission: str):
             HTTPException: If permission is denied
         """
         if not auth.has_permission(permission):
-            logger.warning(f"Permission denied for user {auth.user_id}: {permission}")
+            logger.warning("Permission denied for user %s: %s", auth.user_id, permission)
             raise InsufficientPermissionsException(f"Permission '{permission}' required")
         return auth
 
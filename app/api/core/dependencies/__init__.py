@@ -6,5 +6,6 @@ authorization, and other cross-cutting concerns.
 """
 
 from app.api.core.dependencies.auth import get_current_user
+from app.api.core.dependencies.wallet import get_request_wallet
 
-__all__ = ["get_current_user"]
+__all__ = ["get_current_user", "get_request_wallet"]
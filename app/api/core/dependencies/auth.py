@@ -5,6 +5,8 @@ This module provides dependency functions for route protection and user authenti
 """
 
 import logging
+from uuid import UUID
+
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -54,16 +56,16 @@ async def get_current_user(
             logger.warning("Token missing user ID (sub claim)")
             raise InvalidTokenException("Invalid token: missing user ID")
 
-        user = await session.get(User, user_id)
+        user = await session.get(User, UUID(user_id))
         if not user:
-            logger.warning(f"User not found for ID: {user_id}")
+            logger.warning("User not found for ID: %s", user_id)
             raise UserNotFoundException(f"User not found for ID: {user_id}")
 
-        logger.debug(f"User authenticated: {user.email}")
+        logger.debug("User authenticated: %s", user.email)
         return user
 
     except (InvalidTokenException, UserNotFoundException):
         raise
     except Exception as e:
-        logger.error(f"Authentication failed: {str(e)}", exc_info=True)
+        logger.error("Authentication failed: %s", e, exc_info=True)
         raise InvalidTokenException("Authentication failed")
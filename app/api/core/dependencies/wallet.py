@@ -0,0 +1,37 @@
+"""
+Wallet dependencies for FastAPI routes.
+
+This module provides dependency functions that resolve the authenticated
+user's wallet once per request.
+"""
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.core.auth import AuthContext, get_auth_context
+from app.api.db.database import get_db
+from app.api.v1.models.wallet import Wallet
+from app.api.v1.services.wallet import WalletService
+
+
+async def get_request_wallet(
+    auth: AuthContext = Depends(get_auth_context),
+    session: AsyncSession = Depends(get_db),
+) -> Wallet:
+    """
+    Get the authenticated user's wallet.
+
+    FastAPI caches dependency results per request, so every consumer of this
+    dependency within one request shares a single lookup.
+
+    Args:
+        auth (AuthContext): Authentication context
+        session (AsyncSession): Database session
+
+    Returns:
+        Wallet: The user's wallet
+
+    Raises:
+        WalletNotFoundException: If the user has no wallet
+    """
+    return await WalletService.get_wallet_by_user_id(auth.user_id, session)
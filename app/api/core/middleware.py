@@ -0,0 +1,254 @@
+"""
+ASGI middleware for the Wallet Service API.
+"""
+
+import logging
+from typing import Iterable, Mapping
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.utils.clock import set_request_time
+from app.api.utils.exceptions import WalletServiceException
+
+logger = logging.getLogger(__name__)
+
+_ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+_SAFELISTED_HEADERS = {"accept", "accept-language", "content-language", "content-type"}
+
+
+class RequestClockMiddleware:
+    """Pin a single timestamp for each HTTP request (see app.api.utils.clock)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            set_request_time()
+        await self.app(scope, receive, send)
+
+
+class WalletExceptionMiddleware:
+    """
+    Turn WalletServiceException into the standard error response.
+
+    Meant to be the innermost middleware, so its responses still pass through
+    CORS and compression. If the application already started its response the
+    exception is re-raised, since a second response cannot be sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking)
+        except WalletServiceException as exc:
+            if response_started:
+                raise
+            logger.warning("%s: %s", exc.error_code, exc.message)
+
+            body = orjson.dumps({
+                "status_code": exc.status_code,
+                "status": False,
+                "message": exc.message,
+                "detail": exc.error_code,
+            })
+            await send({
+                "type": "http.response.start",
+                "status": exc.status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+
+
+class FastPathMiddleware:
+    """
+    Serve fixed JSON bodies for selected GET (and HEAD) paths without entering the app.
+
+    Meant to be the outermost middleware, so probes such as /health skip
+    routing, dependency resolution and the rest of the middleware stack.
+    """
+
+    def __init__(self, app: ASGIApp, responses: Mapping[str, bytes]):
+        self.app = app
+        self._responses = {
+            path: (
+                [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+                body,
+            )
+            for path, body in responses.items()
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            response = self._responses.get(scope["path"])
+            if response is not None:
+                headers, body = response
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({
+                    "type": "http.response.body",
+                    "body": body if scope["method"] == "GET" else b"",
+                })
+                return
+        await self.app(scope, receive, send)
+
+
+class FastCORSMiddleware:
+    """
+    CORS middleware for an explicit list of allowed origins.
+
+    Produces the same headers as Starlette's CORSMiddleware configured with
+    explicit origins, but every static header is encoded once at startup and
+    origins are matched against a set, so the per-request work is a single
+    pass over the request headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str],
+        allow_methods: Iterable[str] = ("*",),
+        allow_headers: Iterable[str] = ("*",),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ):
+        self.app = app
+        self._origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+
+        methods = tuple(allow_methods)
+        if "*" in methods:
+            methods = _ALL_METHODS
+        self._methods = frozenset(method.encode("latin-1") for method in methods)
+
+        headers = {header.lower() for header in allow_headers}
+        self._allow_all_headers = "*" in headers
+        self._headers = frozenset(headers | _SAFELISTED_HEADERS)
+
+        self._simple_headers: list[tuple[bytes, bytes]] = []
+        self._preflight_headers: list[tuple[bytes, bytes]] = [
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self._allow_all_headers:
+            self._preflight_headers.append(
+                (b"access-control-allow-headers", ", ".join(sorted(self._headers)).encode("latin-1"))
+            )
+        if allow_credentials:
+            self._simple_headers.append((b"access-control-allow-credentials", b"true"))
+            self._preflight_headers.append((b"access-control-allow-credentials", b"true"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return
+
+        allowed = origin in self._origins
+
+        async def send_with_cors(message: Message):
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                headers.extend(self._simple_headers)
+                if allowed:
+                    headers.append((b"access-control-allow-origin", origin))
+                    _add_vary_origin(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ):
+        """
+        Answer a CORS preflight request without calling the application.
+
+        Args:
+            origin (bytes): Origin header value
+            request_method (bytes): Access-Control-Request-Method header value
+            request_headers (bytes | None): Access-Control-Request-Headers header value
+            send (Send): ASGI send callable
+        """
+        headers = list(self._preflight_headers)
+        failures = []
+
+        if origin in self._origins:
+            headers.append((b"access-control-allow-origin", origin))
+        else:
+            failures.append("origin")
+
+        if request_method not in self._methods:
+            failures.append("method")
+
+        if request_headers is not None:
+            if self._allow_all_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            elif any(
+                header.strip() not in self._headers
+                for header in request_headers.decode("latin-1").lower().split(",")
+            ):
+                failures.append("headers")
+
+        if failures:
+            status, body = 400, ("Disallowed CORS " + ", ".join(failures)).encode()
+        else:
+            status, body = 200, b"OK"
+
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def _add_vary_origin(headers: list[tuple[bytes, bytes]]):
+    """
+    Add Origin to the Vary header of a response header list.
+
+    Args:
+        headers (list[tuple[bytes, bytes]]): Raw ASGI response headers, modified in place
+    """
+    for index, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            headers[index] = (name, value + b", Origin")
+            return
+    headers.append((b"vary", b"Origin"))
@@ -1,6 +1,9 @@
+import asyncio
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 
+import orjson
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
@@ -8,16 +11,37 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson (the asyncpg codec expects str)."""
+    return orjson.dumps(value).decode()
+
+
 db_url = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
 engine = create_async_engine(
     db_url,
     echo=settings.DEBUG,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Reuse the most recently returned connection so idle ones can age out
+    # and the busy ones keep warm backend caches
+    pool_use_lifo=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={
+        # asyncpg keeps this many prepared statements per connection
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # JIT compilation only adds latency to short OLTP queries
+        "server_settings": {"jit": "off"},
+    },
 )
 
+_db_inited = False
+_db_init_lock: Optional[asyncio.Lock] = None
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -42,7 +66,30 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db():
-    """Initialize database tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
-        logger.info("Database tables created successfully")
+    """
+    Initialize database tables and indexes.
+
+    create_all skips tables that already exist, so indexes added to a model
+    later are created separately with CREATE INDEX IF NOT EXISTS.
+
+    Runs once per process: later calls (repeated lifespans from test clients
+    reusing the app) return without touching the database. The lock is
+    created on first use so it binds to the running event loop.
+    """
+    global _db_inited, _db_init_lock
+
+    if _db_inited:
+        return
+    if _db_init_lock is None:
+        _db_init_lock = asyncio.Lock()
+    async with _db_init_lock:
+        if _db_inited:
+            return
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            for table in SQLModel.metadata.sorted_tables:
+                for index in table.indexes:
+                    await conn.execute(CreateIndex(index, if_not_exists=True))
+            logger.info("Database tables created successfully")
+        _db_inited = True
+
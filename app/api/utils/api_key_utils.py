@@ -4,7 +4,36 @@ API Key utility functions.
 This module provides helper functions for API key management.
 """
 
+import hashlib
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+from app.api.utils.clock import now
+
+
+_EXPIRY_UNITS = {"H": ("hours", 1), "D": ("days", 1), "M": ("days", 30), "Y": ("days", 365)}
+
+
+@lru_cache(maxsize=64)
+def expiry_delta(duration_str: str) -> timedelta:
+    """
+    Parse an expiry duration string to a timedelta.
+
+    Results are memoized, since clients use a handful of durations; the cache
+    holds durations only, never absolute timestamps.
+
+    Args:
+        duration_str (str): Duration in format "1Min", "1H", "1D", "1M", "1Y"
+
+    Returns:
+        timedelta: Length of the duration
+    """
+    # Handle "Min" suffix for minutes
+    if duration_str.upper().endswith("MIN"):
+        return timedelta(minutes=int(duration_str[:-3]))
+
+    unit, multiplier = _EXPIRY_UNITS[duration_str[-1].upper()]
+    return timedelta(**{unit: int(duration_str[:-1]) * multiplier})
 
 
 def parse_expiry(duration_str: str) -> datetime:
@@ -17,16 +46,17 @@ def parse_expiry(duration_str: str) -> datetime:
     Returns:
         datetime: Expiry datetime (naive UTC)
     """
-    # Handle "Min" suffix for minutes
-    if duration_str.upper().endswith("MIN"):
-        value = int(duration_str[:-3])
-        return datetime.utcnow() + timedelta(minutes=value)
+    return now() + expiry_delta(duration_str)
 
-    units = {"H": "hours", "D": "days", "M": "days", "Y": "days"}
-    multipliers = {"H": 1, "D": 1, "M": 30, "Y": 365}
 
-    value = int(duration_str[:-1])
-    unit = duration_str[-1].upper()
+def hash_api_key(key: str) -> str:
+    """
+    Hash a raw API key for use as a cache key.
+
+    Args:
+        key (str): Raw API key
 
-    kwargs = {units[unit]: value * multipliers[unit]}
-    return datetime.utcnow() + timedelta(**kwargs)
+    Returns:
+        str: Hex-encoded SHA-256 digest of the key
+    """
+    return hashlib.sha256(key.encode()).hexdigest()
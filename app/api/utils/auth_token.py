@@ -19,6 +19,11 @@ from app.api.utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Signing settings used on every authenticated request, bound once at import
+_JWT_SECRET = settings.JWT_SECRET
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
 
 def create_jwt_token(user_id: uuid.UUID, email: str, expires_in_hours: int = 48) -> str:
     """
@@ -49,11 +54,11 @@ def create_jwt_token(user_id: uuid.UUID, email: str, expires_in_hours: int = 48)
     }
 
     try:
-        token = jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
-        logger.info(f"JWT token created for user: {email}")
+        token = jwt.encode(payload, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
+        logger.info("JWT token created for user: %s", email)
         return token
     except Exception as e:
-        logger.error(f"Failed to create JWT token: {str(e)}", exc_info=True)
+        logger.error("Failed to create JWT token: %s", e, exc_info=True)
         raise
 
 
@@ -79,31 +84,31 @@ async def verify_jwt_token(token: str) -> dict:
         True
     """
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
 
         jti = payload.get("jti")
         if jti:
             is_revoked = await redis_client.is_token_revoked(jti)
             if is_revoked:
-                logger.warning(f"Revoked token attempted to be used: {jti}")
+                logger.warning("Revoked token attempted to be used: %s", jti)
                 raise TokenRevokedException()
 
-        logger.debug(f"JWT token verified for user: {payload.get('email')}")
+        logger.debug("JWT token verified for user: %s", payload.get('email'))
         return payload
 
     except JWTError as e:
         error_str = str(e).lower()
 
         if "expired" in error_str:
-            logger.warning(f"Expired token: {str(e)}")
+            logger.warning("Expired token: %s", e)
             raise TokenExpiredException()
         else:
-            logger.warning(f"Invalid token: {str(e)}")
+            logger.warning("Invalid token: %s", e)
             raise InvalidTokenException()
     except (InvalidTokenException, TokenExpiredException, TokenRevokedException):
         raise
     except Exception as e:
-        logger.error(f"Token verification error: {str(e)}", exc_info=True)
+        logger.error("Token verification error: %s", e, exc_info=True)
         raise InvalidTokenException()
 
 
@@ -134,7 +139,7 @@ def decode_jwt_token(token: str) -> dict:
         )
         return payload
     except Exception as e:
-        logger.error(f"Failed to decode token: {str(e)}", exc_info=True)
+        logger.error("Failed to decode token: %s", e, exc_info=True)
         raise
 
 
@@ -174,7 +179,7 @@ async def revoke_jwt_token(token: str) -> dict:
         ttl = int(exp - current_time)
 
         if ttl <= 0:
-            logger.info(f"Token already expired, skipping revocation: {jti}")
+            logger.info("Token already expired, skipping revocation: %s", jti)
             return {
                 "message": "Token already expired",
                 "revoked_at": datetime.now(timezone.utc).isoformat()
@@ -182,7 +187,7 @@ async def revoke_jwt_token(token: str) -> dict:
 
         await redis_client.revoke_token(jti, ttl)
 
-        logger.info(f"Token revoked successfully: {jti}")
+        logger.info("Token revoked successfully: %s", jti)
 
         return {
             "message": "Successfully revoked token",
@@ -190,5 +195,5 @@ async def revoke_jwt_token(token: str) -> dict:
         }
 
     except Exception as e:
-        logger.error(f"Token revocation failed: {str(e)}", exc_info=True)
+        logger.error("Token revocation failed: %s", e, exc_info=True)
         raise
@@ -0,0 +1,34 @@
+"""
+Request-scoped clock.
+
+This module provides a single "now" per request, so every row a request
+writes carries the same timestamp and the clock is read once.
+"""
+
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+_request_now: ContextVar[Optional[datetime]] = ContextVar("_request_now", default=None)
+
+
+def set_request_time(value: Optional[datetime] = None) -> None:
+    """
+    Pin the current time for the rest of the current request context.
+
+    Args:
+        value (Optional[datetime]): Naive UTC time to pin (default: current time)
+    """
+    _request_now.set(value or datetime.utcnow())
+
+
+def now() -> datetime:
+    """
+    Get the current request's time.
+
+    Falls back to the wall clock outside a request (startup, scripts).
+
+    Returns:
+        datetime: Naive UTC datetime, matching the timestamp columns
+    """
+    return _request_now.get() or datetime.utcnow()
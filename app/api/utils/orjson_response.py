@@ -0,0 +1,55 @@
+"""
+ORJSON response class for the Wallet Service API.
+
+Serializes response payloads with orjson, which encodes UUID and datetime
+values natively and is considerably faster than the standard json module.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.encoders import decimal_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """
+    Encode values orjson does not support natively.
+
+    Decimals are encoded the same way as FastAPI's jsonable_encoder
+    (int when integral, float otherwise) so the wire format is unchanged.
+
+    Args:
+        obj (Any): Value orjson could not serialize
+
+    Returns:
+        Any: JSON-serializable representation
+
+    Raises:
+        TypeError: If the value type is not supported
+    """
+    if isinstance(obj, Decimal):
+        return decimal_encoder(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Render content to JSON bytes.
+
+        Args:
+            content (Any): Response payload
+
+        Returns:
+            bytes: Encoded JSON body
+        """
+        return orjson.dumps(content, default=_default)
@@ -4,7 +4,10 @@ Pagination utilities.
 This module provides reusable pagination helpers for API endpoints.
 """
 
-from typing import TypeVar, Generic
+import base64
+from datetime import datetime
+from typing import Optional, TypeVar, Generic
+from uuid import UUID
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
@@ -56,3 +59,46 @@ class PaginatedResponse(BaseModel, Generic[T]):
             page_size=page_size,
             total_pages=total_pages
         )
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Keyset-paginated response wrapper."""
+    items: list[T]
+    next_cursor: Optional[str] = None
+    limit: int
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """
+    Encode the position of the last item on a page as an opaque cursor.
+
+    Args:
+        created_at: Creation time of the last item
+        item_id: ID of the last item, used to break timestamp ties
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        tuple[datetime, UUID]: Creation time and ID of the last item seen
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, item_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
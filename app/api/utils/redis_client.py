@@ -6,6 +6,7 @@ This module provides Redis connection management and token revocation functions.
 
 import logging
 from typing import Optional
+import orjson
 import redis.asyncio as redis
 from config import settings
 
@@ -13,6 +14,9 @@ logger = logging.getLogger(__name__)
 
 _redis_instance: Optional[redis.Redis] = None
 
+# Sentinel stored for API keys that do not exist
+_API_KEY_MISS = "-"
+
 
 async def get_redis_client() -> redis.Redis:
     """
@@ -38,7 +42,7 @@ async def get_redis_client() -> redis.Redis:
             await _redis_instance.ping()
             logger.info("Redis client connected successfully")
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {str(e)}", exc_info=True)
+            logger.error("Failed to connect to Redis: %s", e, exc_info=True)
             raise
 
     return _redis_instance
@@ -74,9 +78,9 @@ async def revoke_token(jti: str, ttl: int):
         client = await get_redis_client()
         key = f"revoked_token:{jti}"
         await client.setex(key, ttl, "revoked")
-        logger.info(f"Token revoked: {jti} (TTL: {ttl}s)")
+        logger.info("Token revoked: %s (TTL: %ss)", jti, ttl)
     except Exception as e:
-        logger.error(f"Failed to revoke token: {str(e)}", exc_info=True)
+        logger.error("Failed to revoke token: %s", e, exc_info=True)
         raise
 
 
@@ -101,5 +105,252 @@ async def is_token_revoked(jti: str) -> bool:
         result = await client.exists(key)
         return bool(result)
     except Exception as e:
-        logger.error(f"Failed to check token revocation: {str(e)}", exc_info=True)
+        logger.error("Failed to check token revocation: %s", e, exc_info=True)
         return False
+
+
+async def acquire_webhook_lock(reference: str, ttl: int = 86400) -> bool:
+    """
+    Mark a Paystack webhook reference as being processed.
+
+    Uses SET NX so only the first delivery for a reference acquires the lock.
+    If Redis is unavailable the lock is treated as acquired, leaving the
+    database-level idempotency check in charge.
+
+    Args:
+        reference (str): Transaction reference from the webhook payload
+        ttl (int): Time to live in seconds (default: 24 hours)
+
+    Returns:
+        bool: True if this delivery should be processed, False if it is a duplicate
+
+    Example:
+        >>> await acquire_webhook_lock("TXN_1702240000_ab12cd34")
+        True
+    """
+    try:
+        client = await get_redis_client()
+        key = f"paystack:webhook:{reference}"
+        return bool(await client.set(key, "1", nx=True, ex=ttl))
+    except Exception as e:
+        logger.error("Failed to acquire webhook lock: %s", e, exc_info=True)
+        return True
+
+
+async def release_webhook_lock(reference: str):
+    """
+    Release a Paystack webhook lock so a retried delivery can be processed.
+
+    Args:
+        reference (str): Transaction reference from the webhook payload
+
+    Example:
+        >>> await release_webhook_lock("TXN_1702240000_ab12cd34")
+    """
+    try:
+        client = await get_redis_client()
+        await client.delete(f"paystack:webhook:{reference}")
+    except Exception as e:
+        logger.error("Failed to release webhook lock: %s", e, exc_info=True)
+
+
+async def get_api_key_count(user_id: str) -> Optional[int]:
+    """
+    Get the cached active API key count for a user.
+
+    The count is only cached once a user reaches the key limit, so a hit
+    lets key creation be rejected without querying Postgres. Failures are
+    treated as a cache miss.
+
+    Args:
+        user_id (str): User UUID
+
+    Returns:
+        Optional[int]: Cached active key count, or None if not cached
+
+    Example:
+        >>> await get_api_key_count("550e8400-e29b-41d4-a716-446655440000")
+        5
+    """
+    try:
+        client = await get_redis_client()
+        value = await client.get(f"apikey:count:{user_id}")
+        return int(value) if value is not None else None
+    except Exception as e:
+        logger.error("Failed to read API key count: %s", e, exc_info=True)
+        return None
+
+
+async def set_api_key_count(user_id: str, count: int, ttl: int):
+    """
+    Cache the active API key count for a user.
+
+    Args:
+        user_id (str): User UUID
+        count (int): Active key count
+        ttl (int): Time to live in seconds
+
+    Example:
+        >>> await set_api_key_count("550e8400-e29b-41d4-a716-446655440000", 5, 900)
+    """
+    try:
+        client = await get_redis_client()
+        await client.setex(f"apikey:count:{user_id}", ttl, count)
+    except Exception as e:
+        logger.error("Failed to cache API key count: %s", e, exc_info=True)
+
+
+async def clear_api_key_count(user_id: str):
+    """
+    Drop the cached active API key count for a user.
+
+    Args:
+        user_id (str): User UUID
+
+    Example:
+        >>> await clear_api_key_count("550e8400-e29b-41d4-a716-446655440000")
+    """
+    try:
+        client = await get_redis_client()
+        await client.delete(f"apikey:count:{user_id}")
+    except Exception as e:
+        logger.error("Failed to clear API key count: %s", e, exc_info=True)
+
+
+async def get_cached_api_key(key_hash: str) -> Optional[dict]:
+    """
+    Get a cached API key lookup result.
+
+    Args:
+        key_hash (str): SHA-256 hash of the raw API key
+
+    Returns:
+        Optional[dict]: Cached key details, an empty dict for a cached
+        unknown key, or None on a cache miss
+
+    Example:
+        >>> await get_cached_api_key("9f86d081884c7d65...")
+        {'user_id': '550e8400-...', 'email': 'user@example.com', 'permissions': ['read']}
+    """
+    try:
+        client = await get_redis_client()
+        value = await client.get(f"apikey:lookup:{key_hash}")
+        if value is None:
+            return None
+        return orjson.loads(value) if value != _API_KEY_MISS else {}
+    except Exception as e:
+        logger.error("Failed to read cached API key: %s", e, exc_info=True)
+        return None
+
+
+async def cache_api_key(key_hash: str, details: dict, ttl: int):
+    """
+    Cache the details of a valid API key.
+
+    Args:
+        key_hash (str): SHA-256 hash of the raw API key
+        details (dict): JSON-serializable key details
+        ttl (int): Time to live in seconds
+
+    Example:
+        >>> await cache_api_key("9f86d081884c7d65...", {"user_id": "550e8400-..."}, 300)
+    """
+    try:
+        client = await get_redis_client()
+        await client.setex(f"apikey:lookup:{key_hash}", ttl, orjson.dumps(details).decode())
+    except Exception as e:
+        logger.error("Failed to cache API key: %s", e, exc_info=True)
+
+
+async def cache_api_key_miss(key_hash: str, ttl: int = 60):
+    """
+    Negatively cache an unknown API key so repeated attempts skip the database.
+
+    Args:
+        key_hash (str): SHA-256 hash of the raw API key
+        ttl (int): Time to live in seconds (default: 60)
+
+    Example:
+        >>> await cache_api_key_miss("9f86d081884c7d65...")
+    """
+    try:
+        client = await get_redis_client()
+        await client.setex(f"apikey:lookup:{key_hash}", ttl, _API_KEY_MISS)
+    except Exception as e:
+        logger.error("Failed to cache API key miss: %s", e, exc_info=True)
+
+
+async def invalidate_api_key(key_hash: str):
+    """
+    Drop a cached API key lookup.
+
+    Args:
+        key_hash (str): SHA-256 hash of the raw API key
+
+    Example:
+        >>> await invalidate_api_key("9f86d081884c7d65...")
+    """
+    try:
+        client = await get_redis_client()
+        await client.delete(f"apikey:lookup:{key_hash}")
+    except Exception as e:
+        logger.error("Failed to invalidate cached API key: %s", e, exc_info=True)
+
+
+async def get_cached_verification(reference: str) -> Optional[dict]:
+    """
+    Get a cached Paystack verification result.
+
+    Args:
+        reference (str): Transaction reference
+
+    Returns:
+        Optional[dict]: Cached Paystack transaction data, or None on a cache miss
+
+    Example:
+        >>> await get_cached_verification("TXN_1702240000_ab12cd34")
+        {'reference': 'TXN_1702240000_ab12cd34', 'status': 'success', 'amount': 500000}
+    """
+    try:
+        client = await get_redis_client()
+        value = await client.get(f"paystack:verify:{reference}")
+        return orjson.loads(value) if value is not None else None
+    except Exception as e:
+        logger.error("Failed to read cached verification: %s", e, exc_info=True)
+        return None
+
+
+async def cache_verification(reference: str, data: dict, ttl: int):
+    """
+    Cache a Paystack verification result.
+
+    Args:
+        reference (str): Transaction reference
+        data (dict): Paystack transaction data
+        ttl (int): Time to live in seconds
+
+    Example:
+        >>> await cache_verification("TXN_1702240000_ab12cd34", {"status": "success"}, 86400)
+    """
+    try:
+        client = await get_redis_client()
+        await client.setex(f"paystack:verify:{reference}", ttl, orjson.dumps(data).decode())
+    except Exception as e:
+        logger.error("Failed to cache verification: %s", e, exc_info=True)
+
+
+async def invalidate_verification(reference: str):
+    """
+    Drop a cached Paystack verification result.
+
+    Args:
+        reference (str): Transaction reference
+
+    Example:
+        >>> await invalidate_verification("TXN_1702240000_ab12cd34")
+    """
+    try:
+        client = await get_redis_client()
+        await client.delete(f"paystack:verify:{reference}")
+    except Exception as e:
+        logger.error("Failed to invalidate cached verification: %s", e, exc_info=True)
@@ -6,9 +6,10 @@ with proper HTTP status codes and data formatting.
 """
 
 from typing import Optional
-from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
+from app.api.utils.orjson_response import ORJSONResponse
+
 
 def success_response(status_code: int, message: str, data: Optional[dict] = None) -> JSONResponse:
     """
@@ -27,9 +28,7 @@ def success_response(status_code: int, message: str, data: Optional[dict] = None
     if data is not None:
         response_data["data"] = data
 
-    return JSONResponse(
-        status_code=status_code, content=jsonable_encoder(response_data)
-    )
+    return ORJSONResponse(status_code=status_code, content=response_data)
 
 
 def error_response(
@@ -56,7 +55,7 @@ def error_response(
     if detail is not None:
         content["detail"] = detail
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=content
     )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 
 from sqlmodel import Field, SQLModel
-from sqlalchemy import Column
+from sqlalchemy import Column, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 
 
@@ -13,6 +13,16 @@ class APIKey(SQLModel, table=True):
     API Key model for service-to-service authentication and authorization.
     """
 
+    __table_args__ = (
+        # Partial index for the active-key count behind the per-user key limit
+        Index(
+            "ix_apikey_user_id_active",
+            "user_id",
+            "expires_at",
+            postgresql_where=text("revoked = false"),
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="users.id", index=True)
     name: str = Field(max_length=255)
@@ -1,5 +1,5 @@
 import secrets
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 from typing import Optional
@@ -39,6 +39,11 @@ class Transaction(SQLModel, table=True):
     """Transaction model for tracking all wallet transactions."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Serves per-user history queries ordered by newest first; id breaks
+        # created_at ties for keyset pagination
+        Index("ix_transactions_user_id_created_at", "user_id", "created_at", "id"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="users.id", index=True)
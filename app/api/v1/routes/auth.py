@@ -48,7 +48,7 @@ async def google_login():
         return RedirectResponse(url=google_auth_url)
 
     except Exception as e:
-        logger.error(f"Google login failed: {str(e)}", exc_info=True)
+        logger.error("Google login failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="Failed to initiate Google login",
@@ -92,7 +92,7 @@ async def google_callback(
             )
 
             if token_response.status_code != status.HTTP_200_OK:
-                logger.error(f"Token exchange failed: {token_response.text}")
+                logger.error("Token exchange failed: %s", token_response.text)
                 return error_response(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     message="Failed to exchange authorization code",
@@ -108,7 +108,7 @@ async def google_callback(
             )
 
             if user_info_response.status_code != status.HTTP_200_OK:
-                logger.error(f"Failed to get user info: {user_info_response.text}")
+                logger.error("Failed to get user info: %s", user_info_response.text)
                 return error_response(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     message="Failed to retrieve user information",
@@ -144,7 +144,7 @@ async def google_callback(
             expires_in_hours=settings.JWT_EXPIRY_HOURS
         )
 
-        logger.info(f"User {user.email} logged in successfully")
+        logger.info("User %s logged in successfully", user.email)
 
         return success_response(
             status_code=status.HTTP_200_OK,
@@ -159,14 +159,14 @@ async def google_callback(
         )
 
     except httpx.HTTPError as e:
-        logger.error(f"HTTP error during Google callback: {str(e)}", exc_info=True)
+        logger.error("HTTP error during Google callback: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             message="Failed to connect to Google services",
             detail="GOOGLE_SERVICE_UNAVAILABLE"
         )
     except Exception as e:
-        logger.error(f"Google callback failed: {str(e)}", exc_info=True)
+        logger.error("Google callback failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="Authentication failed",
@@ -204,7 +204,7 @@ async def logout(
 
         result = await revoke_jwt_token(token)
 
-        logger.info(f"User {current_user.email} logged out successfully")
+        logger.info("User %s logged out successfully", current_user.email)
 
         return success_response(
             status_code=status.HTTP_200_OK,
@@ -223,7 +223,7 @@ async def logout(
             detail="MISSING_AUTHORIZATION"
         )
     except Exception as e:
-        logger.error(f"Logout failed: {str(e)}", exc_info=True)
+        logger.error("Logout failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="Logout failed",
@@ -5,6 +5,8 @@ This module provides endpoints for managing API keys used for service-to-service
 """
 
 import logging
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,6 +24,7 @@ from app.api.v1.schemas.keys import (
 )
 from app.api.v1.schemas.response import SuccessResponseModel
 from app.api.v1.services.keys import APIKeyService
+from app.api.utils.clock import now
 from app.api.utils.response import success_response, error_response
 from app.api.utils.exceptions import (
     APIKeyNotFoundException,
@@ -56,24 +59,22 @@ async def list_api_keys(
         JSONResponse: Response with list of API keys
     """
     try:
-        from datetime import datetime
-
         api_keys = await APIKeyService.get_user_api_keys(
             user_id=current_user.id,
             session=session,
         )
 
-        logger.info(f"Retrieved {len(api_keys)} API keys for user {current_user.email}")
+        logger.info("Retrieved %s API keys for user %s", len(api_keys), current_user.email)
 
         key_list = [
-            APIKeyListItemResponse(
+            APIKeyListItemResponse.model_construct(
                 id=key.id,
                 name=key.name,
                 permissions=key.permissions or [],
                 expires_at=key.expires_at,
                 created_at=key.created_at,
                 is_active=not key.revoked,
-                is_expired=key.expires_at < datetime.utcnow(),
+                is_expired=key.is_expired,
             ).model_dump()
             for key in api_keys
         ]
@@ -84,7 +85,7 @@ async def list_api_keys(
             data={"key_list": key_list}
         )
     except Exception as e:
-        logger.error(f"API keys retrieval failed: {str(e)}", exc_info=True)
+        logger.error("API keys retrieval failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred",
@@ -98,7 +99,7 @@ async def list_api_keys(
     response_model=SuccessResponseModel[APIKeyListItemResponse]
 )
 async def get_api_key(
-    key_id: str,
+    key_id: UUID,
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -109,7 +110,7 @@ async def get_api_key(
     the actual key value is not returned.
 
     Args:
-        key_id (str): UUID of the API key
+        key_id (UUID): UUID of the API key
         current_user (User): Authenticated user
         session (AsyncSession): Database session
 
@@ -117,38 +118,36 @@ async def get_api_key(
         JSONResponse: Response with API key details
     """
     try:
-        from datetime import datetime
-
         api_key = await APIKeyService.get_api_key(
             user_id=current_user.id,
             key_id=key_id,
             session=session,
         )
 
-        logger.info(f"Retrieved API key {key_id} for user {current_user.email}")
+        logger.info("Retrieved API key %s for user %s", key_id, current_user.email)
 
         return success_response(
             status_code=status.HTTP_200_OK,
             message="API key retrieved successfully",
-            data=APIKeyListItemResponse(
+            data=APIKeyListItemResponse.model_construct(
                 id=api_key.id,
                 name=api_key.name,
                 permissions=api_key.permissions or [],
                 expires_at=api_key.expires_at,
                 created_at=api_key.created_at,
                 is_active=not api_key.revoked,
-                is_expired=api_key.expires_at < datetime.utcnow(),
+                is_expired=api_key.expires_at < now(),
             ).model_dump()
         )
     except APIKeyNotFoundException:
-        logger.error(f"API key not found: {key_id}")
+        logger.error("API key not found: %s", key_id)
         return error_response(
             status_code=status.HTTP_404_NOT_FOUND,
             message="API key not found",
             detail="API_KEY_NOT_FOUND"
         )
     except Exception as e:
-        logger.error(f"API key retrieval failed: {str(e)}", exc_info=True)
+        logger.error("API key retrieval failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred",
@@ -189,7 +188,7 @@ async def create_api_key(
             session=session,
         )
 
-        logger.info(f"API key created for user {current_user.email}")
+        logger.info("API key created for user %s", current_user.email)
 
         return success_response(
             status_code=status.HTTP_201_CREATED,
@@ -205,14 +204,14 @@ async def create_api_key(
             ).model_dump()
         )
     except APIKeyLimitException:
-        logger.error(f"API key limit exceeded for user {current_user.email}")
+        logger.error("API key limit exceeded for user %s", current_user.email)
         return error_response(
             status_code=status.HTTP_400_BAD_REQUEST,
             message="Maximum number of API keys reached",
             detail="API_KEY_LIMIT_EXCEEDED"
         )
     except Exception as e:
-        logger.error(f"API key creation failed: {str(e)}", exc_info=True)
+        logger.error("API key creation failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred",
@@ -251,7 +250,7 @@ async def rollover_api_key(
             session=session,
         )
 
-        logger.info(f"API key rolled over for user {current_user.email}: {old_key_id} -> {new_key.id}")
+        logger.info("API key rolled over for user %s: %s -> %s", current_user.email, old_key_id, new_key.id)
 
         return success_response(
             status_code=status.HTTP_200_OK,
@@ -284,7 +283,7 @@ async def rollover_api_key(
             detail="INVALID_API_KEY"
         )
     except Exception as e:
-        logger.error(f"API key rollover failed: {str(e)}", exc_info=True)
+        logger.error("API key rollover failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred",
@@ -297,7 +296,7 @@ async def rollover_api_key(
     response_model=SuccessResponseModel[RevokeAPIKeyResponse]
 )
 async def revoke_api_key(
-    key_id: str,
+    key_id: UUID,
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -308,7 +307,7 @@ async def revoke_api_key(
     Revoked keys cannot be restored and must be replaced with new keys if needed.
 
     Args:
-        key_id (str): UUID of the API key to revoke
+        key_id (UUID): UUID of the API key to revoke
         current_user (User): Authenticated user
         session (AsyncSession): Database session
 
@@ -322,7 +321,7 @@ async def revoke_api_key(
             session=session,
         )
 
-        logger.info(f"API key revoked for user {current_user.email}: {key_id}")
+        logger.info("API key revoked for user %s: %s", current_user.email, key_id)
 
         return success_response(
             status_code=status.HTTP_200_OK,
@@ -333,21 +332,21 @@ async def revoke_api_key(
             ).model_dump()
         )
     except APIKeyNotFoundException:
-        logger.error(f"API key not found for revocation: {key_id}")
+        logger.error("API key not found for revocation: %s", key_id)
         return error_response(
             status_code=status.HTTP_404_NOT_FOUND,
             message="API key not found",
             detail="API_KEY_NOT_FOUND"
         )
     except InvalidAPIKeyException:
-        logger.error(f"API key already revoked: {key_id}")
+        logger.error("API key already revoked: %s", key_id)
         return error_response(
             status_code=status.HTTP_400_BAD_REQUEST,
             message="API key is already revoked",
             detail="API_KEY_ALREADY_REVOKED"
         )
     except Exception as e:
-        logger.error(f"API key revocation failed: {str(e)}", exc_info=True)
+        logger.error("API key revocation failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred",
@@ -361,7 +360,7 @@ async def revoke_api_key(
     response_model=SuccessResponseModel[dict]
 )
 async def delete_api_key(
-    key_id: str,
+    key_id: UUID,
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
@@ -372,7 +371,7 @@ async def delete_api_key(
     This is different from revoking - the key is completely removed.
 
     Args:
-        key_id (str): UUID of the API key to delete
+        key_id (UUID): UUID of the API key to delete
         current_user (User): Authenticated user
         session (AsyncSession): Database session
 
@@ -386,7 +385,7 @@ async def delete_api_key(
             session=session,
         )
 
-        logger.info(f"API key deleted permanently for user {current_user.email}: {key_id}")
+        logger.info("API key deleted permanently for user %s: %s", current_user.email, key_id)
 
         return success_response(
             status_code=status.HTTP_200_OK,
@@ -397,14 +396,14 @@ async def delete_api_key(
             }
         )
     except APIKeyNotFoundException:
-        logger.error(f"API key not found for deletion: {key_id}")
+        logger.error("API key not found for deletion: %s", key_id)
         return error_response(
             status_code=status.HTTP_404_NOT_FOUND,
             message="API key not found",
             detail="API_KEY_NOT_FOUND"
         )
     except Exception as e:
-        logger.error(f"API key deletion failed: {str(e)}", exc_info=True)
+        logger.error("API key deletion failed: %s", e, exc_info=True)
         return error_response(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message="An unexpected error occurred",
@@ -5,15 +5,23 @@ This module provides endpoints for wallet operations including deposits, transfe
 """
 
 import logging
+from decimal import Decimal
+from typing import Optional
+import msgspec
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Request, Query, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.core.auth import require_permission, AuthContext
+from app.api.core.dependencies import get_request_wallet
 from app.api.db.database import get_db
+from app.api.v1.models.wallet import Wallet
 from app.api.v1.schemas.wallet import (
     DepositRequest,
     DepositResponse,
+    PaystackEvent,
     TransferRequest,
     TransferResponse,
     BalanceResponse,
@@ -23,8 +31,15 @@ from app.api.v1.schemas.wallet import (
 from app.api.v1.schemas.response import SuccessResponseModel
 from app.api.v1.services.wallet import WalletService
 from app.api.v1.services.paystack import PaystackService
+from app.api.utils import redis_client
 from app.api.utils.response import success_response, error_response
-from app.api.utils.pagination import PaginationParams, PaginatedResponse
+from app.api.utils.pagination import (
+    PaginationParams,
+    PaginatedResponse,
+    CursorPaginatedResponse,
+    encode_cursor,
+    decode_cursor,
+)
 from app.api.utils.exceptions import (
     WalletNotFoundException,
     InsufficientBalanceException,
@@ -36,15 +51,64 @@ from app.api.utils.exceptions import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/wallet", tags=["Wallet"])
 
+# HTTP status codes bound once at import for the handlers below
+_OK = status.HTTP_200_OK
+_BAD = status.HTTP_400_BAD_REQUEST
+_UNAUTH = status.HTTP_401_UNAUTHORIZED
+_NOT_FOUND = status.HTTP_404_NOT_FOUND
+_ISE = status.HTTP_500_INTERNAL_SERVER_ERROR
+_SVC = status.HTTP_503_SERVICE_UNAVAILABLE
+
+# Most Paystack events are ignored, so their acknowledgement body is rendered once.
+# A fresh Response wraps it per request because middleware mutates response headers.
+_IGNORED_EVENT_BODY = success_response(
+    status_code=_OK,
+    message="Event ignored",
+    data={"status": True}
+).body
+
+# Verification payloads for successful references. Success is the only final
+# status (a failed reference can still be credited by a later webhook), so
+# these entries never need invalidating.
+_verified_transactions: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Serializes a whole page of transactions in one pydantic-core call
+_TXN_LIST_ADAPTER = TypeAdapter(list[TransactionResponse])
+
+
+def _txn_from_row(txn) -> TransactionResponse:
+    """
+    Build a transaction response from a database row without re-validation.
+
+    Column values are already typed by SQLAlchemy, so model_construct is safe here.
+    Never use this for client-supplied data.
+
+    Args:
+        txn: Transaction row
+
+    Returns:
+        TransactionResponse: Transaction response model
+    """
+    return TransactionResponse.model_construct(
+        transaction_id=str(txn.id),
+        type=txn.type,
+        amount=txn.amount,
+        status=txn.status,
+        reference=txn.reference,
+        created_at=txn.created_at,
+        description=txn.description or ""
+    )
+
 
 @router.post(
     "/deposit",
-    status_code=status.HTTP_200_OK,
+    status_code=_OK,
     response_model=SuccessResponseModel[DepositResponse]
 )
 async def deposit(
     request: DepositRequest,
     auth: AuthContext = Depends(require_permission("deposit")),
+    wallet: Wallet = Depends(get_request_wallet),
     session: AsyncSession = Depends(get_db),
 ) -> JSONResponse:
     """
@@ -57,6 +121,7 @@ async def deposit(
     Args:
         request (DepositRequest): Deposit amount
         auth (AuthContext): Authentication context
+        wallet (Wallet): Authenticated user's wallet
         session (AsyncSession): Database session
 
     Returns:
@@ -64,16 +129,16 @@ async def deposit(
     """
     try:
         result = await WalletService.initialize_deposit(
-            user_id=auth.user_id,
+            wallet=wallet,
             amount=request.amount,
             email=auth.email,
             session=session,
         )
 
-        logger.info(f"Deposit initialized for user {auth.email}: {result['reference']}")
+        logger.info("Deposit initialized for user %s: %s", auth.email, result['reference'])
 
         return success_response(
-            status_code=status.HTTP_200_OK,
+            status_code=_OK,
             message="Deposit initialized successfully",
             data=DepositResponse(
                 reference=result["reference"],
@@ -82,37 +147,30 @@ async def deposit(
                 status="pending"
             ).model_dump()
         )
-    except WalletNotFoundException:
-        logger.error(f"Wallet not found for user {auth.user_id}")
-        return error_response(
-            status_code=status.HTTP_404_NOT_FOUND,
-            message="Wallet not found",
-            detail="WALLET_NOT_FOUND"
-        )
     except PaymentProcessingException:
-        logger.error(f"Payment processing failed for user {auth.email}")
+        logger.error("Payment processing failed for user %s", auth.email)
         return error_response(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=_BAD,
             message="Failed to initialize payment",
             detail="PAYMENT_PROCESSING_ERROR"
         )
     except NetworkException:
         logger.error("Network error connecting to payment gateway")
         return error_response(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status_code=_SVC,
             message="Payment service temporarily unavailable",
             detail="NETWORK_ERROR"
         )
     except Exception as e:
-        logger.error(f"Deposit initialization failed: {str(e)}", exc_info=True)
+        logger.error("Deposit initialization failed: %s", e, exc_info=True)
         return error_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_ISE,
             message="An unexpected error occurred",
             detail="INTERNAL_SERVER_ERROR"
         )
 
 
-@router.post("/paystack/webhook", status_code=status.HTTP_200_OK)
+@router.post("/paystack/webhook", status_code=_OK)
 async def paystack_webhook(
     request: Request,
     session: AsyncSession = Depends(get_db),
@@ -139,54 +197,63 @@ async def paystack_webhook(
         if not PaystackService.verify_webhook_signature(signature, body):
             logger.warning("Invalid Paystack webhook signature")
             return error_response(
-                status_code=status.HTTP_401_UNAUTHORIZED,
+                status_code=_UNAUTH,
                 message="Invalid signature",
                 detail="INVALID_SIGNATURE"
             )
 
-        import json
-        data = json.loads(body)
-
-        event = data.get("event")
-        payload = data.get("data", {})
+        paystack_event = msgspec.json.decode(body, type=PaystackEvent)
+        event = paystack_event.event
+        payload = paystack_event.data
 
-        logger.info(f"Paystack webhook received: {event}")
+        logger.info("Paystack webhook received: %s", event)
 
         if event != "charge.success":
-            logger.info(f"Ignoring webhook event: {event}")
+            logger.info("Ignoring webhook event: %s", event)
+            return Response(content=_IGNORED_EVENT_BODY, media_type="application/json")
+
+        reference = payload.get("reference")
+        paystack_status = payload.get("status")
+
+        if reference and not await redis_client.acquire_webhook_lock(reference):
+            logger.info("Duplicate webhook delivery ignored: %s", reference)
             return success_response(
-                status_code=status.HTTP_200_OK,
-                message="Event ignored",
+                status_code=_OK,
+                message="Already processed",
                 data={"status": True}
             )
 
-        reference = payload.get("reference")
-        paystack_status = payload.get("status")
+        try:
+            await WalletService.process_webhook(
+                reference=reference,
+                status=paystack_status,
+                session=session,
+            )
+        except Exception:
+            if reference:
+                await redis_client.release_webhook_lock(reference)
+            raise
 
-        await WalletService.process_webhook(
-            reference=reference,
-            status=paystack_status,
-            session=session,
-        )
+        await PaystackService.invalidate_verification(reference)
 
-        logger.info(f"Webhook processed successfully: {reference}")
+        logger.info("Webhook processed successfully: %s", reference)
 
         return success_response(
-            status_code=status.HTTP_200_OK,
+            status_code=_OK,
             message="Webhook processed",
             data={"status": True}
         )
     except TransactionNotFoundException:
         logger.error("Transaction not found in webhook processing")
         return error_response(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=_NOT_FOUND,
             message="Transaction not found",
             detail="TRANSACTION_NOT_FOUND"
         )
     except Exception as e:
-        logger.error(f"Webhook processing failed: {str(e)}", exc_info=True)
+        logger.error("Webhook processing failed: %s", e, exc_info=True)
         return error_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_ISE,
             message="Webhook processing failed",
             detail="WEBHOOK_ERROR"
         )
@@ -194,7 +261,7 @@ async def paystack_webhook(
 
 @router.get(
     "/verify/{reference}",
-    status_code=status.HTTP_200_OK,
+    status_code=_OK,
     response_model=SuccessResponseModel[VerifyTransactionResponse]
 )
 async def verify_transaction(
@@ -217,17 +284,27 @@ async def verify_transaction(
         JSONResponse: Transaction verification data
     """
     try:
+        cached = _verified_transactions.get(reference)
+        if cached is not None:
+            return success_response(
+                status_code=_OK,
+                message="Transaction status retrieved",
+                data=cached
+            )
+
         transaction = await WalletService.get_transaction_by_reference(reference, session)
 
         if transaction.status == "pending":
             paystack_data = await PaystackService.verify_transaction(reference)
 
-            amount_in_ngn = paystack_data.get("amount", 0) / 100
+            # Paystack reports kobo as an int; shift the exponent rather than
+            # dividing so the naira amount stays exact (e.g. 500000 -> 5000.00)
+            amount_in_ngn = Decimal(paystack_data.get("amount", 0)).scaleb(-2)
 
-            logger.info(f"Transaction verified via Paystack: {reference} - {paystack_data.get('status')}")
+            logger.info("Transaction verified via Paystack: %s - %s", reference, paystack_data.get('status'))
 
             return success_response(
-                status_code=status.HTTP_200_OK,
+                status_code=_OK,
                 message="Transaction verified with Paystack",
                 data=VerifyTransactionResponse(
                     reference=paystack_data.get("reference", ""),
@@ -238,37 +315,41 @@ async def verify_transaction(
                 ).model_dump()
             )
 
-        logger.info(f"Transaction status from database: {reference} - {transaction.status}")
+        logger.info("Transaction status from database: %s - %s", reference, transaction.status)
+
+        data = VerifyTransactionResponse(
+            reference=transaction.reference,
+            status=transaction.status,
+            amount=transaction.amount,
+            gateway_response="Transaction already processed",
+            paid_at=str(transaction.updated_at) if transaction.status == "success" else None
+        ).model_dump()
+        if transaction.status == "success":
+            _verified_transactions[reference] = data
 
         return success_response(
-            status_code=status.HTTP_200_OK,
+            status_code=_OK,
             message="Transaction status retrieved",
-            data=VerifyTransactionResponse(
-                reference=transaction.reference,
-                status=transaction.status,
-                amount=transaction.amount,
-                gateway_response="Transaction already processed",
-                paid_at=str(transaction.updated_at) if transaction.status == "success" else None
-            ).model_dump()
+            data=data
         )
     except TransactionNotFoundException:
-        logger.error(f"Transaction not found: {reference}")
+        logger.error("Transaction not found: %s", reference)
         return error_response(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=_NOT_FOUND,
             message="Transaction not found",
             detail="TRANSACTION_NOT_FOUND"
         )
     except PaymentProcessingException:
-        logger.error(f"Payment verification failed for transaction: {reference}")
+        logger.error("Payment verification failed for transaction: %s", reference)
         return error_response(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=_BAD,
             message="Failed to verify transaction",
             detail="VERIFICATION_FAILED"
         )
     except Exception as e:
-        logger.error(f"Transaction verification failed: {str(e)}", exc_info=True)
+        logger.error("Transaction verification failed: %s", e, exc_info=True)
         return error_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_ISE,
             message="An unexpected error occurred",
             detail="INTERNAL_SERVER_ERROR"
         )
@@ -276,7 +357,7 @@ async def verify_transaction(
 
 @router.get(
     "/balance",
-    status_code=status.HTTP_200_OK,
+    status_code=_OK,
     response_model=SuccessResponseModel[BalanceResponse]
 )
 async def get_balance(
@@ -296,33 +377,29 @@ async def get_balance(
 
     Returns:
         JSONResponse: Current wallet balance
+
+    Raises:
+        WalletNotFoundException: If the user has no wallet (handled globally)
     """
-    try:
-        wallet = await WalletService.get_wallet_by_user_id(auth.user_id, session)
+    wallet = await WalletService.get_balance(auth.user_id, session)
 
-        logger.info(f"Balance retrieved for user {auth.email}: {wallet.balance}")
+    try:
+        logger.info("Balance retrieved for user %s: %s", auth.email, wallet.balance)
 
         return success_response(
-            status_code=status.HTTP_200_OK,
+            status_code=_OK,
             message="Balance retrieved successfully",
-            data=BalanceResponse(
+            data=BalanceResponse.model_construct(
                 balance=wallet.balance,
                 wallet_number=wallet.wallet_number,
-                user_id=str(wallet.user_id),
+                user_id=str(auth.user_id),
                 currency="NGN"
             ).model_dump()
         )
-    except WalletNotFoundException:
-        logger.error(f"Wallet not found for user {auth.user_id}")
-        return error_response(
-            status_code=status.HTTP_404_NOT_FOUND,
-            message="Wallet not found",
-            detail="WALLET_NOT_FOUND"
-        )
     except Exception as e:
-        logger.error(f"Balance retrieval failed: {str(e)}", exc_info=True)
+        logger.error("Balance retrieval failed: %s", e, exc_info=True)
         return error_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_ISE,
             message="An unexpected error occurred",
             detail="INTERNAL_SERVER_ERROR"
         )
@@ -330,7 +407,7 @@ async def get_balance(
 
 @router.post(
     "/transfer",
-    status_code=status.HTTP_200_OK,
+    status_code=_OK,
     response_model=SuccessResponseModel[TransferResponse]
 )
 async def transfer(
@@ -362,12 +439,12 @@ async def transfer(
         )
 
         logger.info(
-            f"Transfer completed: {auth.email} -> {request.wallet_number} "
-            f"Amount: {request.amount}, Reference: {transaction.reference}"
+            "Transfer completed: %s -> %s Amount: %s, Reference: %s",
+            auth.email, request.wallet_number, request.amount, transaction.reference
         )
 
         return success_response(
-            status_code=status.HTTP_200_OK,
+            status_code=_OK,
             message="Transfer completed successfully",
             data=TransferResponse(
                 status="success",
@@ -380,21 +457,21 @@ async def transfer(
     except WalletNotFoundException:
         logger.error("Wallet not found in transfer")
         return error_response(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=_NOT_FOUND,
             message="Wallet not found",
             detail="WALLET_NOT_FOUND"
         )
     except InsufficientBalanceException:
-        logger.error(f"Insufficient balance for transfer by user {auth.email}")
+        logger.error("Insufficient balance for transfer by user %s", auth.email)
         return error_response(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=_BAD,
             message="Insufficient balance",
             detail="INSUFFICIENT_BALANCE"
         )
     except Exception as e:
-        logger.error(f"Transfer failed: {str(e)}", exc_info=True)
+        logger.error("Transfer failed: %s", e, exc_info=True)
         return error_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_ISE,
             message="An unexpected error occurred",
             detail="INTERNAL_SERVER_ERROR"
         )
@@ -402,7 +479,7 @@ async def transfer(
 
 @router.get(
     "/transactions",
-    status_code=status.HTTP_200_OK,
+    status_code=_OK,
     response_model=SuccessResponseModel[PaginatedResponse[TransactionResponse]]
 )
 async def get_transactions(
@@ -437,20 +514,11 @@ async def get_transactions(
             limit=pagination.limit
         )
 
-        logger.info(f"Retrieved {len(transactions)} of {total} transactions for user {auth.email}")
-
-        transaction_list = [
-            TransactionResponse(
-                transaction_id=str(txn.id),
-                type=txn.type,
-                amount=txn.amount,
-                status=txn.status,
-                reference=txn.reference,
-                created_at=txn.created_at,
-                description=txn.description or ""
-            )
-            for txn in transactions
-        ]
+        logger.info("Retrieved %s of %s transactions for user %s", len(transactions), total, auth.email)
+
+        transaction_list = _TXN_LIST_ADAPTER.dump_python(
+            [_txn_from_row(txn) for txn in transactions]
+        )
 
         paginated_data = PaginatedResponse.create(
             items=transaction_list,
@@ -460,14 +528,85 @@ async def get_transactions(
         )
 
         return success_response(
-            status_code=status.HTTP_200_OK,
+            status_code=_OK,
             message="Transactions retrieved successfully",
             data=paginated_data.model_dump()
         )
     except Exception as e:
-        logger.error(f"Transaction retrieval failed: {str(e)}", exc_info=True)
+        logger.error("Transaction retrieval failed: %s", e, exc_info=True)
+        return error_response(
+            status_code=_ISE,
+            message="An unexpected error occurred",
+            detail="INTERNAL_SERVER_ERROR"
+        )
+
+
+@router.get(
+    "/transactions/feed",
+    status_code=_OK,
+    response_model=SuccessResponseModel[CursorPaginatedResponse[TransactionResponse]]
+)
+async def get_transaction_feed(
+    cursor: Optional[str] = Query(default=None, description="Cursor from the previous page"),
+    limit: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    auth: AuthContext = Depends(require_permission("read")),
+    session: AsyncSession = Depends(get_db),
+) -> JSONResponse:
+    """
+    Get cursor-paginated transaction history for the authenticated user.
+
+    Unlike /transactions, no total count is computed and deep pages cost the
+    same as the first one. Pass next_cursor from a response to fetch the next page.
+
+    Requires either:
+    - JWT authentication
+    - API key with 'read' permission
+
+    Args:
+        cursor (Optional[str]): Cursor from the previous page (omit for the first page)
+        limit (int): Items per page (default: 20, max: 100)
+        auth (AuthContext): Authentication context
+        session (AsyncSession): Database session
+
+    Returns:
+        JSONResponse: Page of transactions and the cursor for the next page
+    """
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        return error_response(
+            status_code=_BAD,
+            message="Invalid cursor",
+            detail="INVALID_CURSOR"
+        )
+
+    try:
+        transactions, next_position = await WalletService.get_user_transactions_after(
+            auth.user_id,
+            session,
+            cursor=position,
+            limit=limit
+        )
+
+        logger.info("Retrieved %s transactions for user %s", len(transactions), auth.email)
+
+        page = CursorPaginatedResponse(
+            items=_TXN_LIST_ADAPTER.dump_python(
+                [_txn_from_row(txn) for txn in transactions]
+            ),
+            next_cursor=encode_cursor(*next_position) if next_position else None,
+            limit=limit
+        )
+
+        return success_response(
+            status_code=_OK,
+            message="Transactions retrieved successfully",
+            data=page.model_dump()
+        )
+    except Exception as e:
+        logger.error("Transaction retrieval failed: %s", e, exc_info=True)
         return error_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_ISE,
             message="An unexpected error occurred",
             detail="INTERNAL_SERVER_ERROR"
         )
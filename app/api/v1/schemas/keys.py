@@ -3,9 +3,43 @@ API Key management request and response schemas.
 """
 
 from datetime import datetime
-from typing import List
+from typing import Annotated, List, Literal
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+_EXPIRY_UNITS = ("Min", "H", "D", "M", "Y")
+_EXPIRY_PATTERN = "^[0-9]+(Min|H|D|M|Y)$"
+
+
+def _validate_expiry(value: str) -> str:
+    """
+    Validate an expiry duration such as "1Min", "1H", "7D", "1M" or "1Y".
+
+    A single scan over the digits followed by a suffix lookup, used in place
+    of a regex pattern constraint.
+
+    Args:
+        value (str): Expiry duration
+
+    Returns:
+        str: The unchanged expiry duration
+
+    Raises:
+        ValueError: If the duration is not digits followed by a known unit
+    """
+    i = 0
+    length = len(value)
+    while i < length and "0" <= value[i] <= "9":
+        i += 1
+    if i == 0 or value[i:] not in _EXPIRY_UNITS:
+        raise ValueError(f"expiry must match {_EXPIRY_PATTERN}")
+    return value
+
+
+ExpiryDuration = Annotated[str, AfterValidator(_validate_expiry)]
+
+# Scopes checked by require_permission on the wallet routes
+Permission = Literal["deposit", "transfer", "read"]
 
 
 class CreateAPIKeyRequest(BaseModel):
@@ -14,11 +48,13 @@ class CreateAPIKeyRequest(BaseModel):
     name: str = Field(
         ..., min_length=1, max_length=255, description="API key name/label"
     )
-    permissions: list[str] = Field(..., description="List of permission scopes")
-    expiry: str = Field(
+    permissions: list[Permission] = Field(
+        ..., min_length=1, description="List of permission scopes"
+    )
+    expiry: ExpiryDuration = Field(
         ...,
-        pattern="^[0-9]+(Min|H|D|M|Y)$",
         description='Expiry duration (e.g., "1Min", "1H", "7D", "1Y")',
+        json_schema_extra={"pattern": _EXPIRY_PATTERN},
     )
 
     class Config:
@@ -42,8 +78,10 @@ class APIKeyListItemResponse(BaseModel):
     is_active: bool = Field(default=True, description="Key active status")
     is_expired: bool = Field(default=False, description="Whether key is expired")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "name": "Production API Key",
@@ -53,7 +91,8 @@ class APIKeyListItemResponse(BaseModel):
                 "is_active": True,
                 "is_expired": False,
             }
-        }
+        },
+    )
 
 
 class APIKeyResponse(BaseModel):
@@ -67,8 +106,10 @@ class APIKeyResponse(BaseModel):
     created_at: datetime = Field(..., description="Key creation datetime")
     is_active: bool = Field(default=True, description="Key active status")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "api_key": "sk_live_abcdef123456...",
@@ -78,17 +119,18 @@ class APIKeyResponse(BaseModel):
                 "created_at": "2025-12-10T14:30:00Z",
                 "is_active": True,
             }
-        }
+        },
+    )
 
 
 class RolloverAPIKeyRequest(BaseModel):
     """Request model for rolling over an expired API key."""
 
     expired_key_id: UUID = Field(..., description="UUID of expired key to rollover")
-    expiry: str = Field(
+    expiry: ExpiryDuration = Field(
         ...,
-        pattern="^[0-9]+(Min|H|D|M|Y)$",
         description='New expiry duration (e.g., "1Min", "1H", "7D", "1Y")',
+        json_schema_extra={"pattern": _EXPIRY_PATTERN},
     )
 
     class Config:
@@ -106,8 +148,10 @@ class RolloverAPIKeyResponse(BaseModel):
     old_key_id: UUID = Field(..., description="ID of revoked expired key")
     new_key: "APIKeyResponse" = Field(..., description="New API key details")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "old_key_id": "550e8400-e29b-41d4-a716-446655440000",
                 "new_key": {
@@ -120,7 +164,8 @@ class RolloverAPIKeyResponse(BaseModel):
                     "is_active": True,
                 },
             }
-        }
+        },
+    )
 
 
 class RevokeAPIKeyResponse(BaseModel):
@@ -131,12 +176,15 @@ class RevokeAPIKeyResponse(BaseModel):
     message: str = Field(default="API key revoked successfully")
     revoked_at: datetime = Field(..., description="Revocation timestamp")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "key_id": "550e8400-e29b-41d4-a716-446655440000",
                 "status": "revoked",
                 "message": "API key revoked successfully",
                 "revoked_at": "2025-12-10T14:35:00Z",
             }
-        }
+        },
+    )
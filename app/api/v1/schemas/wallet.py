@@ -4,7 +4,9 @@ Wallet request and response schemas.
 
 from decimal import Decimal
 from datetime import datetime
-from pydantic import BaseModel, Field
+
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DepositRequest(BaseModel):
@@ -26,15 +28,18 @@ class DepositResponse(BaseModel):
     amount: Decimal = Field(..., description="Deposit amount")
     status: str = Field(default="pending", description="Transaction status")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "reference": "TXN-1702240000-12345",
                 "authorization_url": "https://checkout.paystack.com/...",
                 "amount": "5000.00",
                 "status": "pending",
             }
-        }
+        },
+    )
 
 
 class TransferRequest(BaseModel):
@@ -62,8 +67,10 @@ class TransferResponse(BaseModel):
     amount: Decimal = Field(..., description="Transferred amount")
     timestamp: datetime = Field(..., description="Transfer timestamp")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "status": "success",
                 "message": "Transfer completed",
@@ -71,7 +78,8 @@ class TransferResponse(BaseModel):
                 "amount": "1000.00",
                 "timestamp": "2025-12-10T14:30:00Z",
             }
-        }
+        },
+    )
 
 
 class BalanceResponse(BaseModel):
@@ -82,15 +90,18 @@ class BalanceResponse(BaseModel):
     user_id: str = Field(..., description="User UUID")
     currency: str = Field(default="NGN", description="Currency code")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "balance": "25000.50",
                 "wallet_number": "WALLET-123456",
                 "user_id": "550e8400-e29b-41d4-a716-446655440000",
                 "currency": "NGN",
             }
-        }
+        },
+    )
 
 
 class TransactionResponse(BaseModel):
@@ -104,8 +115,10 @@ class TransactionResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     description: str = Field(default="", description="Transaction description")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "transaction_id": "550e8400-e29b-41d4-a716-446655440000",
                 "type": "deposit",
@@ -115,7 +128,8 @@ class TransactionResponse(BaseModel):
                 "created_at": "2025-12-10T14:30:00Z",
                 "description": "Paystack deposit",
             }
-        }
+        },
+    )
 
 
 class PaystackWebhookRequest(BaseModel):
@@ -138,6 +152,18 @@ class PaystackWebhookRequest(BaseModel):
         }
 
 
+class PaystackEvent(msgspec.Struct, frozen=True):
+    """
+    Internal Paystack webhook event decoded with msgspec.
+
+    PaystackWebhookRequest documents the payload in OpenAPI; the webhook
+    handler decodes the raw body into this struct instead.
+    """
+
+    event: str = ""
+    data: dict = {}
+
+
 class VerifyTransactionResponse(BaseModel):
     """Paystack transaction verification response model."""
 
@@ -147,8 +173,10 @@ class VerifyTransactionResponse(BaseModel):
     gateway_response: str = Field(..., description="Payment gateway response")
     paid_at: str | None = Field(None, description="Payment completion timestamp")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "reference": "TXN-1702240000-12345",
                 "status": "success",
@@ -156,4 +184,5 @@ class VerifyTransactionResponse(BaseModel):
                 "gateway_response": "Successful",
                 "paid_at": "2025-12-10T14:30:00Z",
             }
-        }
+        },
+    )
@@ -1,10 +1,12 @@
 import logging
 from typing import Optional
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.api.v1.models.user import User
+from app.api.v1.services.wallet import WalletService
 from app.api.utils.exceptions import UserNotFoundException
 
 logger = logging.getLogger(__name__)
@@ -38,47 +40,42 @@ class AuthService:
             raise ValueError("Database session is required")
 
         try:
-            try:
-                user = await AuthService.get_user_by_email(email, session)
-                logger.info(f"Existing user found: {email}")
-
-                from app.api.v1.services.wallet import WalletService
-                try:
-                    await WalletService.get_wallet_by_user_id(user.id, session)
-                except Exception:
-                    await WalletService.create_wallet(user.id, session)
-                    logger.info(f"Wallet created for existing user: {email}")
-
-                return user
-            except UserNotFoundException:
-                logger.info(f"User not found, creating new user: {email}")
-
-                user = User(
-                    email=email,
-                    name=name,
-                    provider_user_id=provider_user_id,
-                    profile_picture_url=profile_picture_url,
-                    auth_provider="google",
-                )
-                session.add(user)
-                await session.commit()
-                await session.refresh(user)
-                logger.info(f"New user created successfully: {email}")
-
-                # Create wallet for new user
-                from app.api.v1.services.wallet import WalletService
+            user = await AuthService.get_user_by_email(email, session)
+        except UserNotFoundException:
+            user = None
+
+        if user:
+            logger.info("Existing user found: %s", email)
+
+            if not await WalletService.wallet_exists(user.id, session):
                 await WalletService.create_wallet(user.id, session)
-                logger.info(f"Wallet created for new user: {email}")
+                logger.info("Wallet created for existing user: %s", email)
 
-                return user
+            return user
 
-        except UserNotFoundException:
-            raise
-        except Exception as e:
+        logger.info("User not found, creating new user: %s", email)
+
+        user = User(
+            email=email,
+            name=name,
+            provider_user_id=provider_user_id,
+            profile_picture_url=profile_picture_url,
+            auth_provider="google",
+        )
+        try:
+            session.add(user)
+            await session.flush()
+
+            # Create the wallet in the same transaction so one commit covers both rows
+            await WalletService.create_wallet(user.id, session, commit=False)
+            await session.commit()
+        except Exception:
             await session.rollback()
-            logger.error(f"Failed to get or create user: {str(e)}", exc_info=True)
             raise
 
+        logger.info("New user and wallet created successfully: %s", email)
+        return user
+
     @staticmethod
     async def get_user_by_email(email: str, session: AsyncSession) -> User:
         """
@@ -94,28 +91,22 @@ class AuthService:
         Raises:
             UserNotFoundException: If user not found
         """
-        try:
-            statement = select(User).where(User.email == email)
-            result = await session.execute(statement)
-            user = result.scalar_one_or_none()
+        statement = select(User).where(User.email == email)
+        result = await session.execute(statement)
+        user = result.scalar_one_or_none()
 
-            if not user:
-                raise UserNotFoundException(f"User {email} not found")
+        if not user:
+            raise UserNotFoundException(f"User {email} not found")
 
-            return user
-        except UserNotFoundException:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to get user by email: {str(e)}", exc_info=True)
-            raise
+        return user
 
     @staticmethod
-    async def get_user_by_id(user_id: str, session: AsyncSession) -> User:
+    async def get_user_by_id(user_id: UUID, session: AsyncSession) -> User:
         """
         Get user by ID.
 
         Args:
-            user_id (str): User UUID
+            user_id (UUID): User UUID
             session (AsyncSession): Database session
 
         Returns:
@@ -124,16 +115,10 @@ class AuthService:
         Raises:
             UserNotFoundException: If user not found
         """
-        try:
-            user = await session.get(User, user_id)
+        user = await session.get(User, user_id)
 
-            if not user:
-                raise UserNotFoundException(f"User {user_id} not found")
+        if not user:
+            raise UserNotFoundException(f"User {user_id} not found")
 
-            return user
-        except UserNotFoundException:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to get user by ID: {str(e)}", exc_info=True)
-            raise
+        return user
 
@@ -5,9 +5,9 @@ This module provides business logic for creating, revoking, and managing API key
 """
 
 import logging
-from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import Row, func, insert, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -17,11 +17,83 @@ from app.api.utils.exceptions import (
     InvalidAPIKeyException,
     APIKeyNotFoundException
 )
-from app.api.utils.api_key_utils import parse_expiry
+from app.api.utils import redis_client
+from app.api.utils.api_key_utils import hash_api_key, parse_expiry
+from app.api.utils.clock import now
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Settings read on every key mint, bound once at import
+_MAX_KEYS = settings.API_KEY_MAX_PER_USER
+_REDIS_TTL = settings.REDIS_TTL
+
+
+async def _insert_within_limit(api_key: APIKey, session: AsyncSession) -> bool:
+    """
+    Insert an API key only if its owner is below the active key limit.
+
+    The limit check and the insert run as a single INSERT ... SELECT, so
+    there is no round-trip between counting and writing. A transaction-scoped
+    advisory lock keyed on the owner serialises concurrent mints for the same
+    user, since under READ COMMITTED two inserts could otherwise both see a
+    count below the limit.
+
+    Args:
+        api_key (APIKey): Fully populated key to insert
+        session (AsyncSession): Database session
+
+    Returns:
+        bool: True if the key was inserted, False if the limit was reached
+    """
+    table = APIKey.__table__
+    await session.execute(
+        select(func.pg_advisory_xact_lock(func.hashtextextended(str(api_key.user_id), 0)))
+    )
+
+    values = {column.name: getattr(api_key, column.name) for column in table.columns}
+
+    active_count = (
+        select(func.count())
+        .select_from(table)
+        .where(
+            table.c.user_id == api_key.user_id,
+            table.c.revoked == False,
+            table.c.expires_at > api_key.created_at
+        )
+        .scalar_subquery()
+    )
+    source = select(
+        *(literal(value, table.c[name].type) for name, value in values.items())
+    ).where(active_count < _MAX_KEYS)
+
+    statement = insert(table).from_select(list(values), source).returning(table.c.id)
+    result = await session.execute(statement)
+    return result.scalar_one_or_none() is not None
+
+
+async def _cache_limit_reached(user_id: UUID, session: AsyncSession):
+    """
+    Cache that a user is at the API key limit until their next key expires.
+
+    Args:
+        user_id (UUID): User UUID
+        session (AsyncSession): Database session
+    """
+    timestamp = now()
+    statement = select(func.min(APIKey.expires_at)).where(
+        APIKey.user_id == user_id,
+        APIKey.revoked == False,
+        APIKey.expires_at > timestamp
+    )
+    next_expiry = (await session.execute(statement)).scalar_one_or_none()
+    if next_expiry is None:
+        return
+
+    ttl = min(_REDIS_TTL, int((next_expiry - timestamp).total_seconds()))
+    if ttl > 0:
+        await redis_client.set_api_key_count(str(user_id), _MAX_KEYS, ttl)
+
 
 class APIKeyService:
     """Service class for API key management operations."""
@@ -50,20 +122,11 @@ class APIKeyService:
         Raises:
             APIKeyLimitException: If user has reached max API keys
         """
-        statement = select(APIKey).where(
-            APIKey.user_id == user_id,
-            APIKey.revoked == False,
-            APIKey.expires_at > datetime.utcnow()
-        )
-        result = await session.execute(statement)
-        active_keys = result.scalars().all()
-
-        logger.info(f"User {user_id} has {len(active_keys)} active (non-expired, non-revoked) API keys (max: {settings.API_KEY_MAX_PER_USER})")
-
-        if len(active_keys) >= settings.API_KEY_MAX_PER_USER:
-            logger.warning(f"API key limit reached for user {user_id}: {len(active_keys)}/{settings.API_KEY_MAX_PER_USER}")
+        cached_count = await redis_client.get_api_key_count(str(user_id))
+        if cached_count is not None and cached_count >= _MAX_KEYS:
+            logger.warning("API key limit reached for user %s (cached)", user_id)
             raise APIKeyLimitException(
-                f"Maximum {settings.API_KEY_MAX_PER_USER} API keys allowed"
+                f"Maximum {_MAX_KEYS} API keys allowed"
             )
 
         api_key = APIKey(
@@ -74,11 +137,16 @@ class APIKeyService:
             expires_at=parse_expiry(expiry_duration)
         )
 
-        session.add(api_key)
+        if not await _insert_within_limit(api_key, session):
+            logger.warning("API key limit reached for user %s (max: %s)", user_id, _MAX_KEYS)
+            await _cache_limit_reached(user_id, session)
+            raise APIKeyLimitException(
+                f"Maximum {_MAX_KEYS} API keys allowed"
+            )
+
         await session.commit()
-        await session.refresh(api_key)
 
-        logger.info(f"API key created successfully for user {user_id}: {api_key.id}")
+        logger.info("API key created successfully for user %s: %s", user_id, api_key.id)
         return api_key
 
     @staticmethod
@@ -107,34 +175,25 @@ class APIKeyService:
         old_key = await session.get(APIKey, expired_key_id)
 
         if not old_key or old_key.user_id != user_id:
-            logger.warning(f"Rollover failed: API key {expired_key_id} not found for user {user_id}")
+            logger.warning("Rollover failed: API key %s not found for user %s", expired_key_id, user_id)
             raise APIKeyNotFoundException("API key not found")
 
-        if old_key.expires_at > datetime.utcnow():
-            logger.warning(f"Rollover failed: API key {expired_key_id} is not expired yet")
+        if old_key.expires_at > now():
+            logger.warning("Rollover failed: API key %s is not expired yet", expired_key_id)
             raise InvalidAPIKeyException("API key must be expired to rollover")
 
-        logger.info(f"Rolling over expired API key {expired_key_id} for user {user_id}")
-
-        old_key.revoked = True
-        old_key.updated_at = datetime.utcnow()
-
-        statement = select(APIKey).where(
-            APIKey.user_id == user_id,
-            APIKey.revoked == False,
-            APIKey.expires_at > datetime.utcnow()
-        )
-        result = await session.execute(statement)
-        active_keys = result.scalars().all()
-
-        logger.info(f"After revoking old key, user {user_id} has {len(active_keys)} active keys")
+        logger.info("Rolling over expired API key %s for user %s", expired_key_id, user_id)
 
-        if len(active_keys) >= settings.API_KEY_MAX_PER_USER:
-            logger.warning(f"Rollover failed: User {user_id} already has {len(active_keys)} active keys")
+        cached_count = await redis_client.get_api_key_count(str(user_id))
+        if cached_count is not None and cached_count >= _MAX_KEYS:
+            logger.warning("Rollover failed: User %s already has the maximum active keys (cached)", user_id)
             raise APIKeyLimitException(
-                f"Maximum {settings.API_KEY_MAX_PER_USER} API keys allowed. Revoke an active key first."
+                f"Maximum {_MAX_KEYS} API keys allowed. Revoke an active key first."
             )
 
+        old_key.revoked = True
+        old_key.updated_at = now()
+
         new_key = APIKey(
             user_id=user_id,
             name=f"{old_key.name} (rolled over)",
@@ -143,17 +202,23 @@ class APIKeyService:
             expires_at=parse_expiry(expiry_duration),
         )
 
-        session.add(new_key)
+        if not await _insert_within_limit(new_key, session):
+            logger.warning("Rollover failed: User %s already has the maximum active keys", user_id)
+            await _cache_limit_reached(user_id, session)
+            raise APIKeyLimitException(
+                f"Maximum {_MAX_KEYS} API keys allowed. Revoke an active key first."
+            )
+
         await session.commit()
-        await session.refresh(new_key)
+        await redis_client.invalidate_api_key(hash_api_key(old_key.key))
 
-        logger.info(f"API key rolled over successfully: {expired_key_id} -> {new_key.id}")
+        logger.info("API key rolled over successfully: %s -> %s", expired_key_id, new_key.id)
         return old_key.id, new_key
 
     @staticmethod
     async def revoke_api_key(
         user_id: UUID,
-        key_id: str,
+        key_id: UUID,
         session: AsyncSession,
     ) -> APIKey:
         """
@@ -161,7 +226,7 @@ class APIKeyService:
 
         Args:
             user_id (UUID): User UUID
-            key_id (str): API key UUID to revoke
+            key_id (UUID): API key UUID to revoke
             session (AsyncSession): Database session
 
         Returns:
@@ -174,50 +239,65 @@ class APIKeyService:
         api_key = await session.get(APIKey, key_id)
 
         if not api_key or api_key.user_id != user_id:
-            logger.warning(f"Revoke failed: API key {key_id} not found for user {user_id}")
+            logger.warning("Revoke failed: API key %s not found for user %s", key_id, user_id)
             raise APIKeyNotFoundException("API key not found")
 
         if api_key.revoked:
-            logger.warning(f"Revoke failed: API key {key_id} already revoked")
+            logger.warning("Revoke failed: API key %s already revoked", key_id)
             raise InvalidAPIKeyException("API key already revoked")
 
-        logger.info(f"Revoking API key {key_id} for user {user_id}")
+        logger.info("Revoking API key %s for user %s", key_id, user_id)
 
         api_key.revoked = True
-        api_key.updated_at = datetime.utcnow()
+        api_key.updated_at = now()
 
         await session.commit()
         await session.refresh(api_key)
+        await redis_client.clear_api_key_count(str(user_id))
+        await redis_client.invalidate_api_key(hash_api_key(api_key.key))
 
-        logger.info(f"API key revoked successfully: {key_id}")
+        logger.info("API key revoked successfully: %s", key_id)
         return api_key
 
     @staticmethod
     async def get_user_api_keys(
         user_id: UUID,
         session: AsyncSession,
-    ) -> list[APIKey]:
+    ) -> list[Row]:
         """
         Get all API keys for a user.
 
+        Only the columns shown in key listings are selected, as plain rows
+        rather than ORM instances. Expiry is evaluated by Postgres against its
+        own UTC clock, so each row carries an is_expired flag.
+
         Args:
             user_id (UUID): User UUID
             session (AsyncSession): Database session
 
         Returns:
-            list[APIKey]: List of user's API keys (both active and revoked)
+            list[Row]: Key rows for the user's keys (both active and revoked)
         """
-        statement = select(APIKey).where(APIKey.user_id == user_id)
+        is_expired = (APIKey.expires_at < func.timezone("utc", func.now())).label("is_expired")
+        statement = select(
+            APIKey.id,
+            APIKey.name,
+            APIKey.permissions,
+            APIKey.expires_at,
+            APIKey.created_at,
+            APIKey.revoked,
+            is_expired,
+        ).where(APIKey.user_id == user_id)
         result = await session.execute(statement)
-        api_keys = result.scalars().all()
+        api_keys = result.all()
 
-        logger.info(f"Retrieved {len(api_keys)} API keys for user {user_id}")
-        return list(api_keys)
+        logger.info("Retrieved %s API keys for user %s", len(api_keys), user_id)
+        return api_keys
 
     @staticmethod
     async def get_api_key(
         user_id: UUID,
-        key_id: str,
+        key_id: UUID,
         session: AsyncSession,
     ) -> APIKey:
         """
@@ -225,7 +305,7 @@ class APIKeyService:
 
         Args:
             user_id (UUID): User UUID
-            key_id (str): API key UUID
+            key_id (UUID): API key UUID
             session (AsyncSession): Database session
 
         Returns:
@@ -237,16 +317,16 @@ class APIKeyService:
         api_key = await session.get(APIKey, key_id)
 
         if not api_key or api_key.user_id != user_id:
-            logger.warning(f"API key {key_id} not found for user {user_id}")
+            logger.warning("API key %s not found for user %s", key_id, user_id)
             raise APIKeyNotFoundException("API key not found")
 
-        logger.debug(f"Retrieved API key {key_id} for user {user_id}")
+        logger.debug("Retrieved API key %s for user %s", key_id, user_id)
         return api_key
 
     @staticmethod
     async def delete_api_key(
         user_id: UUID,
-        key_id: str,
+        key_id: UUID,
         session: AsyncSession,
     ) -> UUID:
         """
@@ -254,7 +334,7 @@ class APIKeyService:
 
         Args:
             user_id (UUID): User UUID
-            key_id (str): API key UUID to delete
+            key_id (UUID): API key UUID to delete
             session (AsyncSession): Database session
 
         Returns:
@@ -266,14 +346,16 @@ class APIKeyService:
         api_key = await session.get(APIKey, key_id)
 
         if not api_key or api_key.user_id != user_id:
-            logger.warning(f"Delete failed: API key {key_id} not found for user {user_id}")
+            logger.warning("Delete failed: API key %s not found for user %s", key_id, user_id)
             raise APIKeyNotFoundException("API key not found")
 
-        logger.info(f"Deleting API key {key_id} for user {user_id}")
+        logger.info("Deleting API key %s for user %s", key_id, user_id)
 
         deleted_key_id = api_key.id
         await session.delete(api_key)
         await session.commit()
+        await redis_client.clear_api_key_count(str(user_id))
+        await redis_client.invalidate_api_key(hash_api_key(api_key.key))
 
-        logger.info(f"API key deleted successfully: {key_id}")
+        logger.info("API key deleted successfully: %s", key_id)
         return deleted_key_id
\ No newline at end of file
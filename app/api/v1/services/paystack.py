@@ -2,16 +2,76 @@
 Paystack payment service.
 """
 
+import asyncio
 import logging
 import hmac
-import hashlib
+from typing import Optional
+
 import httpx
+import orjson
+from cachetools import TTLCache
 
+from app.api.utils import redis_client
 from app.api.utils.exceptions import PaymentProcessingException, NetworkException
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+_PAYSTACK_KEY_BYTES = settings.PAYSTACK_SECRET_KEY.encode()
+
+_client: Optional[httpx.AsyncClient] = None
+
+# Short-lived verification results, so clients polling a pending reference
+# share one upstream call every few seconds instead of one per poll.
+_verify_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+_verify_inflight: dict[str, asyncio.Future] = {}
+
+# Paystack statuses that will not change again, and how long Redis keeps
+# verification results for them versus for everything else. "abandoned"
+# only means the customer has not finished paying and can still succeed.
+_TERMINAL_STATUSES = frozenset({"success", "failed"})
+_TERMINAL_VERIFY_TTL = 86400
+_PENDING_VERIFY_TTL = 5
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared Paystack HTTP client, creating it on first use.
+
+    A closed client (after an application shutdown in the same process) is
+    replaced, so a later lifespan gets a working connection pool.
+
+    Returns:
+        httpx.AsyncClient: Pooled HTTP/2 client bound to the Paystack API
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=settings.PAYSTACK_API_URL,
+            http2=True,
+            timeout=httpx.Timeout(settings.PAYSTACK_TIMEOUT, connect=3.0),
+            limits=httpx.Limits(
+                max_connections=settings.PAYSTACK_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.PAYSTACK_MAX_KEEPALIVE,
+            ),
+            headers={
+                "Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}",
+                "Content-Type": "application/json",
+            },
+        )
+    return _client
+
+
+async def close_paystack_client() -> None:
+    """Close the shared Paystack HTTP client and its pooled connections."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Paystack client closed")
+
 
 class PaystackService:
     """Service for Paystack payment integration."""
@@ -35,34 +95,24 @@ class PaystackService:
             PaymentProcessingException: If Paystack API fails
         """
         try:
-            headers = {
-                "Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}",
-                "Content-Type": "application/json",
-            }
             payload = {
                 "email": email,
                 "amount": amount,
                 "reference": reference,
             }
 
-            async with httpx.AsyncClient(timeout=settings.PAYSTACK_TIMEOUT) as client:
-                resp = await client.post(
-                    f"{settings.PAYSTACK_API_URL}/transaction/initialize",
-                    json=payload,
-                    headers=headers,
+            resp = await _get_client().post("/transaction/initialize", content=orjson.dumps(payload))
+            if resp.status_code != 200:
+                raise PaymentProcessingException(
+                    "Paystack initialization failed"
                 )
-                if resp.status_code != 200:
-                    raise PaymentProcessingException(
-                        "Paystack initialization failed"
-                    )
-                data = resp.json()
-                return data["data"]
+            return orjson.loads(resp.content)["data"]
 
         except httpx.HTTPError as e:
-            logger.error(f"Paystack API error: {str(e)}", exc_info=True)
+            logger.error("Paystack API error: %s", e, exc_info=True)
             raise NetworkException("Failed to reach Paystack API")
         except Exception as e:
-            logger.error(f"Transaction initialization failed: {str(e)}", exc_info=True)
+            logger.error("Transaction initialization failed: %s", e, exc_info=True)
             raise PaymentProcessingException("Failed to initialize transaction")
 
     @staticmethod
@@ -70,6 +120,10 @@ class PaystackService:
         """
         Verify Paystack transaction status.
 
+        Results are cached in-process for a few seconds and in Redis (for a
+        day once the status is terminal), and concurrent callers for the same
+        reference share a single in-flight Paystack request.
+
         Args:
             reference (str): Transaction reference
 
@@ -79,21 +133,64 @@ class PaystackService:
         Raises:
             PaymentProcessingException: If verification fails
         """
-        try:
-            headers = {"Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}"}
+        cached = _verify_cache.get(reference)
+        if cached is not None:
+            return cached
 
-            async with httpx.AsyncClient(timeout=settings.PAYSTACK_TIMEOUT) as client:
-                resp = await client.get(
-                    f"{settings.PAYSTACK_API_URL}/transaction/verify/{reference}",
-                    headers=headers,
-                )
-                if resp.status_code != 200:
-                    raise PaymentProcessingException("Verification failed")
-                data = resp.json()
-                return data["data"]
+        cached = await redis_client.get_cached_verification(reference)
+        if cached is not None:
+            _verify_cache[reference] = cached
+            return cached
+
+        inflight = _verify_inflight.get(reference)
+        if inflight is None:
+            inflight = asyncio.ensure_future(PaystackService._fetch_verification(reference))
+            _verify_inflight[reference] = inflight
+            inflight.add_done_callback(lambda _: _verify_inflight.pop(reference, None))
+
+        return await asyncio.shield(inflight)
+
+    @staticmethod
+    async def invalidate_verification(reference: str) -> None:
+        """
+        Drop any cached verification result for a reference.
+
+        Args:
+            reference (str): Transaction reference
+        """
+        _verify_cache.pop(reference, None)
+        await redis_client.invalidate_verification(reference)
+
+    @staticmethod
+    async def _fetch_verification(reference: str) -> dict:
+        """
+        Fetch a transaction's status from Paystack and cache the result.
+
+        Args:
+            reference (str): Transaction reference
+
+        Returns:
+            dict: Transaction status and amount
+
+        Raises:
+            PaymentProcessingException: If verification fails
+        """
+        try:
+            resp = await _get_client().get(f"/transaction/verify/{reference}")
+            if resp.status_code != 200:
+                raise PaymentProcessingException("Verification failed")
+            data = orjson.loads(resp.content)["data"]
+            _verify_cache[reference] = data
+            ttl = (
+                _TERMINAL_VERIFY_TTL
+                if data.get("status") in _TERMINAL_STATUSES
+                else _PENDING_VERIFY_TTL
+            )
+            await redis_client.cache_verification(reference, data, ttl)
+            return data
 
         except Exception as e:
-            logger.error(f"Transaction verification failed: {str(e)}", exc_info=True)
+            logger.error("Transaction verification failed: %s", e, exc_info=True)
             raise PaymentProcessingException("Failed to verify transaction")
 
     @staticmethod
@@ -108,13 +205,10 @@ class PaystackService:
         Returns:
             bool: Signature is valid
         """
+        expected = hmac.digest(_PAYSTACK_KEY_BYTES, payload, "sha512")
         try:
-            expected = hmac.new(
-                settings.PAYSTACK_SECRET_KEY.encode(),
-                payload,
-                hashlib.sha512,
-            ).hexdigest()
-            return hmac.compare_digest(signature, expected)
-        except Exception as e:
-            logger.error(f"Webhook signature verification failed: {str(e)}")
+            signature_bytes = bytes.fromhex(signature)
+        except ValueError:
+            logger.warning("Malformed webhook signature")
             return False
+        return hmac.compare_digest(signature_bytes, expected)
@@ -8,13 +8,16 @@ import logging
 import secrets
 from datetime import datetime
 from decimal import Decimal
+from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import Row, bindparam, func, insert, lambda_stmt, or_, tuple_, update
 from sqlmodel import select, desc
 
 from app.api.v1.models.wallet import Wallet, Transaction
 from app.api.v1.services.paystack import PaystackService
+from app.api.utils.clock import now
 from app.api.utils.exceptions import (
     WalletNotFoundException,
     InsufficientBalanceException,
@@ -24,18 +27,43 @@ from app.api.utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Columns read when rendering transaction history
+_HISTORY_COLUMNS = (
+    Transaction.id,
+    Transaction.type,
+    Transaction.amount,
+    Transaction.status,
+    Transaction.reference,
+    Transaction.created_at,
+    Transaction.description,
+)
+
+# Hottest lookups as cached lambda statements, so SQLAlchemy skips rebuilding
+# and re-compiling them on every call
+_WALLET_BY_USER = lambda_stmt(
+    lambda: select(Wallet).where(Wallet.user_id == bindparam("user_id"))
+)
+_WALLET_BY_USER_FOR_UPDATE = lambda_stmt(
+    lambda: select(Wallet).where(Wallet.user_id == bindparam("user_id")).with_for_update()
+)
+_TRANSACTION_BY_REFERENCE = lambda_stmt(
+    lambda: select(Transaction).where(Transaction.reference == bindparam("reference"))
+)
+
 
 class WalletService:
     """Service class for wallet management operations."""
 
     @staticmethod
-    async def create_wallet(user_id: UUID, session: AsyncSession) -> Wallet:
+    async def create_wallet(user_id: UUID, session: AsyncSession, commit: bool = True) -> Wallet:
         """
         Create a wallet for a user.
 
         Args:
             user_id (UUID): User UUID
             session (AsyncSession): Database session
+            commit (bool): Commit the session after inserting. Pass False to let
+                the caller commit the wallet together with its own writes.
 
         Returns:
             Wallet: Created wallet
@@ -48,20 +76,24 @@ class WalletService:
         existing_wallet = result.scalar_one_or_none()
 
         if existing_wallet:
-            logger.info(f"Wallet already exists for user {user_id}")
+            logger.info("Wallet already exists for user %s", user_id)
             return existing_wallet
 
-        wallet = Wallet(
-            user_id=user_id,
-            wallet_number=Wallet.generate_wallet_number(),
-            balance=Decimal("0.00")
+        statement = (
+            insert(Wallet)
+            .values(
+                user_id=user_id,
+                wallet_number=Wallet.generate_wallet_number(),
+                balance=Decimal("0.00")
+            )
+            .returning(Wallet)
         )
+        result = await session.execute(statement)
+        wallet = result.scalar_one()
+        if commit:
+            await session.commit()
 
-        session.add(wallet)
-        await session.commit()
-        await session.refresh(wallet)
-
-        logger.info(f"Wallet created for user {user_id}: {wallet.wallet_number}")
+        logger.info("Wallet created for user %s: %s", user_id, wallet.wallet_number)
         return wallet
 
     @staticmethod
@@ -80,18 +112,57 @@ class WalletService:
         Raises:
             WalletNotFoundException: If wallet not found
         """
-        statement = select(Wallet).where(Wallet.user_id == user_id)
-        if for_update:
-            statement = statement.with_for_update()
-        result = await session.execute(statement)
+        statement = _WALLET_BY_USER_FOR_UPDATE if for_update else _WALLET_BY_USER
+        result = await session.execute(statement, {"user_id": user_id})
         wallet = result.scalar_one_or_none()
 
         if not wallet:
-            logger.warning(f"Wallet not found for user {user_id}")
+            logger.warning("Wallet not found for user %s", user_id)
             raise WalletNotFoundException(f"Wallet not found for user {user_id}")
 
         return wallet
 
+    @staticmethod
+    async def get_balance(user_id: UUID, session: AsyncSession) -> Row:
+        """
+        Get a user's wallet balance without loading the full wallet row.
+
+        Args:
+            user_id (UUID): User UUID
+            session (AsyncSession): Database session
+
+        Returns:
+            Row: (balance, wallet_number) row for the user's wallet
+
+        Raises:
+            WalletNotFoundException: If wallet not found
+        """
+        statement = select(Wallet.balance, Wallet.wallet_number).where(Wallet.user_id == user_id)
+        result = await session.execute(statement)
+        row = result.first()
+
+        if row is None:
+            logger.warning("Wallet not found for user %s", user_id)
+            raise WalletNotFoundException(f"Wallet not found for user {user_id}")
+
+        return row
+
+    @staticmethod
+    async def wallet_exists(user_id: UUID, session: AsyncSession) -> bool:
+        """
+        Check whether a user has a wallet without loading the row.
+
+        Args:
+            user_id (UUID): User UUID
+            session (AsyncSession): Database session
+
+        Returns:
+            bool: True if the user has a wallet
+        """
+        statement = select(1).where(Wallet.user_id == user_id).limit(1)
+        result = await session.execute(statement)
+        return result.scalar() is not None
+
     @staticmethod
     async def get_wallet_by_number(wallet_number: str, session: AsyncSession, for_update: bool = False) -> Wallet:
         """
@@ -115,14 +186,14 @@ class WalletService:
         wallet = result.scalar_one_or_none()
 
         if not wallet:
-            logger.warning(f"Wallet not found: {wallet_number}")
+            logger.warning("Wallet not found: %s", wallet_number)
             raise WalletNotFoundException(f"Wallet number {wallet_number} not found")
 
         return wallet
 
     @staticmethod
     async def initialize_deposit(
-        user_id: UUID,
+        wallet: Wallet,
         amount: Decimal,
         email: str,
         session: AsyncSession,
@@ -131,7 +202,7 @@ class WalletService:
         Initialize deposit transaction with Paystack.
 
         Args:
-            user_id (UUID): User UUID
+            wallet (Wallet): Wallet to credit, already loaded for the request
             amount (Decimal): Amount to deposit
             email (str): User email
             session (AsyncSession): Database session
@@ -140,41 +211,73 @@ class WalletService:
             dict: Transaction details with payment URL
 
         Raises:
-            WalletNotFoundException: If wallet not found
+            DuplicateTransactionException: If no unique reference could be allocated
         """
-        wallet = await WalletService.get_wallet_by_user_id(user_id, session)
-
-        reference = f"TXN_{int(datetime.utcnow().timestamp())}_{secrets.token_hex(4)}"
-
-        statement = select(Transaction).where(Transaction.reference == reference)
-        result = await session.execute(statement)
-        if result.scalar_one_or_none():
+        user_id = wallet.user_id
+
+        # The pending row is written before Paystack is called, so a reference
+        # collision is caught while nothing exists upstream yet. 64 random bits
+        # make collisions negligible; one retry with a fresh reference covers
+        # the rest.
+        transaction_id = None
+        for _ in range(2):
+            reference = f"TXN_{int(now().timestamp())}_{secrets.token_hex(8)}"
+            result = await session.execute(
+                pg_insert(Transaction)
+                .values(
+                    user_id=user_id,
+                    wallet_id=wallet.id,
+                    type="deposit",
+                    amount=amount,
+                    status="pending",
+                    reference=reference,
+                    paystack_reference=reference,
+                    description="Paystack deposit"
+                )
+                .on_conflict_do_nothing(index_elements=[Transaction.reference])
+                .returning(Transaction.id)
+            )
+            transaction_id = result.scalar_one_or_none()
+            if transaction_id is not None:
+                break
+            logger.warning("Transaction reference collision: %s", reference)
+
+        if transaction_id is None:
+            await session.rollback()
+            logger.error("Could not allocate a unique transaction reference for user %s", user_id)
             raise DuplicateTransactionException("Transaction reference already exists")
 
-        amount_in_kobo = int(amount * 100)
-        paystack_data = await PaystackService.initialize_transaction(
-            email=email,
-            amount=amount_in_kobo,
-            reference=reference
-        )
+        # Commit the reservation so no pooled connection or row lock is held
+        # across the Paystack round trip.
+        await session.commit()
 
-        transaction = Transaction(
-            user_id=user_id,
-            wallet_id=wallet.id,
-            type="deposit",
-            amount=amount,
-            status="pending",
-            reference=reference,
-            paystack_reference=reference,
-            payment_url=paystack_data["authorization_url"],
-            description="Paystack deposit"
+        amount_in_kobo = int(amount * 100)
+        try:
+            paystack_data = await PaystackService.initialize_transaction(
+                email=email,
+                amount=amount_in_kobo,
+                reference=reference
+            )
+        except Exception:
+            await session.execute(
+                update(Transaction)
+                .where(Transaction.id == transaction_id, Transaction.status == "pending")
+                .values(status="failed", updated_at=now())
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            logger.warning("Deposit %s marked failed after Paystack initialization error", reference)
+            raise
+
+        await session.execute(
+            update(Transaction)
+            .where(Transaction.id == transaction_id)
+            .values(payment_url=paystack_data["authorization_url"])
+            .execution_options(synchronize_session=False)
         )
-
-        session.add(transaction)
         await session.commit()
-        await session.refresh(transaction)
 
-        logger.info(f"Deposit initialized for user {user_id}: {reference}")
+        logger.info("Deposit initialized for user %s: %s", user_id, reference)
 
         return {
             "reference": reference,
@@ -187,57 +290,82 @@ class WalletService:
         reference: str,
         status: str,
         session: AsyncSession,
-    ) -> Transaction:
+    ) -> bool:
         """
         Process Paystack webhook and credit wallet.
 
+        A successful charge marks the transaction and credits its wallet in a
+        single statement (a data-modifying CTE). The status guards live in the
+        UPDATE's WHERE clause, so duplicate deliveries are a single no-op
+        statement and concurrent retries cannot credit the wallet twice. The
+        transaction is only looked up when nothing was updated.
+
         Args:
             reference (str): Transaction reference
             status (str): Transaction status from Paystack
             session (AsyncSession): Database session
 
         Returns:
-            Transaction: Updated transaction
+            bool: True if the transaction was updated, False if it was already processed
 
         Raises:
             TransactionNotFoundException: If transaction not found
         """
-        statement = select(Transaction).where(Transaction.reference == reference)
-        result = await session.execute(statement)
-        transaction = result.scalar_one_or_none()
+        logger.info("Processing webhook for transaction %s: %s", reference, status)
+        timestamp = now()
 
-        if not transaction:
-            logger.error(f"Transaction not found: {reference}")
-            raise TransactionNotFoundException(f"Transaction {reference} not found")
+        if status == "success":
+            credited = (
+                update(Transaction)
+                .where(Transaction.reference == reference, Transaction.status != "success")
+                .values(status="success", updated_at=timestamp)
+                .returning(Transaction.wallet_id, Transaction.amount)
+                .cte("credited")
+            )
+            statement = (
+                update(Wallet)
+                .where(Wallet.id == credited.c.wallet_id)
+                .values(balance=Wallet.balance + credited.c.amount, updated_at=timestamp)
+                .returning(Wallet.wallet_number, Wallet.balance, credited.c.amount)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            # Only a pending transaction can fail; repeated failure
+            # notifications then match no row instead of rewriting it
+            statement = (
+                update(Transaction)
+                .where(Transaction.reference == reference, Transaction.status == "pending")
+                .values(status="failed", updated_at=timestamp)
+                .returning(Transaction.id)
+                .execution_options(synchronize_session=False)
+            )
 
-        if transaction.status == "success":
-            logger.info(f"Transaction already processed: {reference}")
-            return transaction
+        result = await session.execute(statement)
+        row = result.first()
+        await session.commit()
 
-        logger.info(f"Processing webhook for transaction {reference}: {status}")
+        if row is None:
+            current_status = await session.scalar(
+                select(Transaction.status).where(Transaction.reference == reference)
+            )
+            if current_status is None:
+                logger.error("Transaction not found: %s", reference)
+                raise TransactionNotFoundException(f"Transaction {reference} not found")
+
+            logger.info("Transaction already processed: %s", reference)
+            return False
 
         if status == "success":
-            transaction.status = "success"
-            transaction.updated_at = datetime.utcnow()
-
-            wallet = await session.get(Wallet, transaction.wallet_id)
-            if wallet:
-                old_balance = wallet.balance
-                wallet.balance += transaction.amount
-                wallet.updated_at = datetime.utcnow()
-                logger.info(
-                    f"Wallet {wallet.wallet_number} credited: "
-                    f"{old_balance} -> {wallet.balance} (+{transaction.amount})"
-                )
+            logger.info(
+                "Wallet %s credited: %s (+%s)",
+                row.wallet_number,
+                row.balance,
+                row.amount
+            )
         else:
-            transaction.status = "failed"
-            transaction.updated_at = datetime.utcnow()
-            logger.warning(f"Transaction failed: {reference}")
+            logger.warning("Transaction failed: %s", reference)
 
-        await session.commit()
-        await session.refresh(transaction)
-
-        return transaction
+        return True
 
     @staticmethod
     async def transfer(
@@ -263,51 +391,86 @@ class WalletService:
             InsufficientBalanceException: If sender has insufficient balance
         """
         async with session.begin():
-            sender_wallet = await WalletService.get_wallet_by_user_id(sender_user_id, session, for_update=True)
-            recipient_wallet = await WalletService.get_wallet_by_number(recipient_wallet_number, session, for_update=True)
+            result = await session.execute(
+                select(Wallet.id, Wallet.user_id, Wallet.wallet_number).where(
+                    or_(
+                        Wallet.user_id == sender_user_id,
+                        Wallet.wallet_number == recipient_wallet_number,
+                    )
+                )
+            )
+            rows = result.all()
+            sender = next((row for row in rows if row.user_id == sender_user_id), None)
+            recipient = next(
+                (row for row in rows if row.wallet_number == recipient_wallet_number), None
+            )
+
+            if sender is None:
+                logger.warning("Wallet not found for user: %s", sender_user_id)
+                raise WalletNotFoundException("Wallet not found")
+            if recipient is None:
+                logger.warning("Wallet not found: %s", recipient_wallet_number)
+                raise WalletNotFoundException("Wallet not found")
 
-            if sender_wallet.id == recipient_wallet.id:
-                logger.warning(f"User {sender_user_id} attempted to transfer to their own wallet")
+            if sender.id == recipient.id:
+                logger.warning("User %s attempted to transfer to their own wallet", sender_user_id)
                 raise WalletNotFoundException("Cannot transfer to your own wallet")
 
-            if sender_wallet.balance < amount:
+            # Lock both rows in id order first, so opposite transfers between
+            # the same wallets queue on the lower id instead of deadlocking.
+            await session.execute(
+                select(Wallet.id)
+                .where(Wallet.id.in_((sender.id, recipient.id)))
+                .order_by(Wallet.id)
+                .with_for_update()
+            )
+
+            # The balance guard is checked against the locked sender row, so
+            # when funds are short nothing is updated and the credit never runs.
+            sender_balance = await session.scalar(
+                update(Wallet)
+                .where(Wallet.id == sender.id, Wallet.balance >= amount)
+                .values(balance=Wallet.balance - amount, updated_at=now())
+                .returning(Wallet.balance)
+                .execution_options(synchronize_session=False)
+            )
+
+            if sender_balance is None:
                 logger.warning(
-                    f"Insufficient balance for transfer: "
-                    f"{sender_wallet.wallet_number} (balance: {sender_wallet.balance}, required: {amount})"
-                )
-                raise InsufficientBalanceException(
-                    f"Insufficient balance. Available: {sender_wallet.balance}"
+                    "Insufficient balance for transfer: %s (required: %s)",
+                    sender.wallet_number,
+                    amount
                 )
+                raise InsufficientBalanceException("Insufficient balance")
+
+            recipient_balance = await session.scalar(
+                update(Wallet)
+                .where(Wallet.id == recipient.id)
+                .values(balance=Wallet.balance + amount, updated_at=now())
+                .returning(Wallet.balance)
+                .execution_options(synchronize_session=False)
+            )
 
-            reference = f"TFR_{int(datetime.utcnow().timestamp())}_{secrets.token_hex(4)}"
+            reference = f"TFR_{int(now().timestamp())}_{secrets.token_hex(4)}"
             transaction = Transaction(
                 user_id=sender_user_id,
-                wallet_id=sender_wallet.id,
+                wallet_id=sender.id,
                 type="transfer",
                 amount=amount,
                 status="success",
                 reference=reference,
-                sender_wallet_number=sender_wallet.wallet_number,
-                recipient_wallet_number=recipient_wallet.wallet_number,
-                description=f"Transfer to {recipient_wallet.wallet_number}"
+                sender_wallet_number=sender.wallet_number,
+                recipient_wallet_number=recipient.wallet_number,
+                description=f"Transfer to {recipient.wallet_number}"
             )
-
-            old_sender_balance = sender_wallet.balance
-            sender_wallet.balance -= amount
-            sender_wallet.updated_at = datetime.utcnow()
-
-            old_recipient_balance = recipient_wallet.balance
-            recipient_wallet.balance += amount
-            recipient_wallet.updated_at = datetime.utcnow()
-
             session.add(transaction)
             await session.flush()
-            await session.refresh(transaction)
 
             logger.info(
-                f"Transfer completed: {reference} | "
-                f"Sender: {old_sender_balance} -> {sender_wallet.balance} | "
-                f"Recipient: {old_recipient_balance} -> {recipient_wallet.balance}"
+                "Transfer completed: %s | Sender balance: %s | Recipient balance: %s",
+                reference,
+                sender_balance,
+                recipient_balance
             )
 
             return transaction
@@ -329,12 +492,11 @@ class WalletService:
         Raises:
             TransactionNotFoundException: If transaction not found
         """
-        statement = select(Transaction).where(Transaction.reference == reference)
-        result = await session.execute(statement)
+        result = await session.execute(_TRANSACTION_BY_REFERENCE, {"reference": reference})
         transaction = result.scalar_one_or_none()
 
         if not transaction:
-            logger.warning(f"Transaction not found: {reference}")
+            logger.warning("Transaction not found: %s", reference)
             raise TransactionNotFoundException(f"Transaction {reference} not found")
 
         return transaction
@@ -345,10 +507,12 @@ class WalletService:
         session: AsyncSession,
         offset: int = 0,
         limit: int = 20
-    ) -> tuple[list[Transaction], int]:
+    ) -> tuple[list[Row], int]:
         """
         Get user transaction history with pagination.
 
+        Only the columns rendered in transaction responses are selected.
+
         Args:
             user_id (UUID): User UUID
             session (AsyncSession): Database session
@@ -356,7 +520,7 @@ class WalletService:
             limit (int): Maximum number of records to return
 
         Returns:
-            tuple[list[Transaction], int]: Tuple of (transactions list, total count)
+            tuple[list[Row], int]: Tuple of (transaction rows, total count)
         """
         count_statement = (
             select(func.count())
@@ -367,14 +531,59 @@ class WalletService:
         total = count_result.scalar() or 0
 
         statement = (
-            select(Transaction)
+            select(*_HISTORY_COLUMNS)
             .where(Transaction.user_id == user_id)
             .order_by(desc(Transaction.created_at))
             .offset(offset)
             .limit(limit)
         )
         result = await session.execute(statement)
-        transactions = result.scalars().all()
+        transactions = result.all()
+
+        logger.info("Retrieved %s of %s transactions for user %s", len(transactions), total, user_id)
+        return transactions, total
+
+    @staticmethod
+    async def get_user_transactions_after(
+        user_id: UUID,
+        session: AsyncSession,
+        cursor: Optional[tuple[datetime, UUID]] = None,
+        limit: int = 20
+    ) -> tuple[list[Row], Optional[tuple[datetime, UUID]]]:
+        """
+        Get user transaction history with keyset pagination.
+
+        Seeks past the (created_at, id) of the last row already seen instead of
+        counting and skipping rows, so every page costs one index range scan
+        regardless of how long the history is.
+
+        Args:
+            user_id (UUID): User UUID
+            session (AsyncSession): Database session
+            cursor (Optional[tuple[datetime, UUID]]): (created_at, id) of the last row seen
+            limit (int): Maximum number of records to return
+
+        Returns:
+            tuple[list[Row], Optional[tuple[datetime, UUID]]]: Tuple of
+            (transaction rows, cursor for the next page or None on the last page)
+        """
+        statement = select(*_HISTORY_COLUMNS).where(Transaction.user_id == user_id)
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(Transaction.created_at, Transaction.id) < tuple_(*cursor)
+            )
+        statement = statement.order_by(
+            desc(Transaction.created_at), desc(Transaction.id)
+        ).limit(limit + 1)
+
+        result = await session.execute(statement)
+        transactions = result.all()
+
+        next_cursor = None
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            last = transactions[-1]
+            next_cursor = (last.created_at, last.id)
 
-        logger.info(f"Retrieved {len(transactions)} of {total} transactions for user {user_id}")
-        return list(transactions), total
+        logger.info("Retrieved %s transactions for user %s", len(transactions), user_id)
+        return transactions, next_cursor
@@ -5,13 +5,20 @@ Load settings from environment variables.
 """
 
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass
 
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
+load_dotenv()
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """
     Application settings loaded from environment variables.
+
+    Values are read once at import (after loading .env) into an immutable,
+    slotted instance, so attribute access is a plain slot read.
     """
     
     # Application Configuration
@@ -20,6 +27,7 @@ class Settings(BaseSettings):
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     APP_PORT: int = int(os.getenv("APP_PORT", "8000"))
+    WORKERS: int = int(os.getenv("WORKERS", "1"))
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-super-secret-key-change-in-production")
     SERVER_NAME: str = os.getenv("SERVER_NAME", "_")
     
@@ -39,6 +47,10 @@ class Settings(BaseSettings):
         "DATABASE_URL",
         "postgresql+asyncpg://wallet_user:wallet_password@db:5432/wallet_db"
     )
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
     
     # Redis Configuration
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://redis:6379/0")
@@ -64,6 +76,8 @@ class Settings(BaseSettings):
     PAYSTACK_WEBHOOK_SECRET: str = os.getenv("PAYSTACK_WEBHOOK_SECRET", "")
     PAYSTACK_API_URL: str = os.getenv("PAYSTACK_API_URL", "https://api.paystack.co")
     PAYSTACK_TIMEOUT: int = int(os.getenv("PAYSTACK_TIMEOUT", "30"))
+    PAYSTACK_MAX_CONNECTIONS: int = int(os.getenv("PAYSTACK_MAX_CONNECTIONS", "64"))
+    PAYSTACK_MAX_KEEPALIVE: int = int(os.getenv("PAYSTACK_MAX_KEEPALIVE", "32"))
     
     # API Keys Configuration
     API_KEY_MAX_PER_USER: int = int(os.getenv("API_KEY_MAX_PER_USER", "5"))
@@ -72,11 +86,6 @@ class Settings(BaseSettings):
     # API Settings
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = APP_NAME
-    
-    class Config:
-        """Pydantic config."""
-        env_file = ".env"
-        case_sensitive = True
 
 
 # Create settings instance
@@ -3,46 +3,130 @@ Wallet Service API - Main Application Entry Point
 """
 
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import orjson
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
 
 from app.api.core.logger import setup_logging
+from app.api.core.middleware import (
+    FastCORSMiddleware,
+    FastPathMiddleware,
+    RequestClockMiddleware,
+    WalletExceptionMiddleware,
+)
 from app.api.v1.routes import auth, keys, wallet
+from app.api.v1.services.paystack import close_paystack_client
 from app.api.db.database import init_db
-from app.api.utils.exceptions import WalletServiceException
-from app.api.utils.handlers import wallet_service_exception_handler, validation_exception_handler
+from app.api.utils.orjson_response import ORJSONResponse
+from app.api.utils.redis_client import close_redis_client
+from app.api.utils.handlers import validation_exception_handler
 from config import settings
 
 setup_logging()
 logger = logging.getLogger("app")
 
+# Configured CORS origins, de-duplicated with blanks dropped; the CORS
+# middleware turns them into a frozenset for O(1) origin checks
+_ALLOWED_ORIGINS = tuple(
+    dict.fromkeys(
+        origin
+        for origin in (settings.FRONTEND_URL, settings.DEV_URL, settings.APP_URL)
+        if origin
+    )
+)
+
+# Methods and request headers the API actually serves; explicit lists let the
+# CORS middleware pre-join its preflight headers instead of echoing requests
+_CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+_CORS_HEADERS = ("authorization", "content-type", "x-api-key")
+
+# Interactive docs and the OpenAPI schema are only served in DEBUG
+_DOCS_URL = "/docs" if settings.DEBUG else None
+_REDOC_URL = "/redoc" if settings.DEBUG else None
+_OPENAPI_URL = "/openapi.json" if settings.DEBUG else None
+
+# Static probe responses, encoded once; settings never change after startup
+_HEALTH = orjson.dumps({
+    "status": "healthy",
+    "app_name": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "environment": settings.ENVIRONMENT,
+})
+_ROOT = orjson.dumps({
+    "message": f"Welcome to {settings.APP_NAME}",
+    "version": settings.APP_VERSION,
+    "docs": _DOCS_URL,
+    "redoc": _REDOC_URL,
+})
+
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def _db_lifespan(app: FastAPI):
     """
-    Manage application lifespan - startup and shutdown events.
-    
+    Create database tables on startup.
+
     Args:
         app (FastAPI): FastAPI application instance
-        
+
     Yields:
         None
     """
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
     try:
         await init_db()
         logger.info("Database initialization completed")
     except Exception as e:
-        logger.error(f"Database initialization failed: {str(e)}", exc_info=True)
+        logger.error("Database initialization failed: %s", e, exc_info=True)
         raise
-    
     yield
+
+
+@asynccontextmanager
+async def _clients_lifespan(app: FastAPI):
+    """
+    Close the shared Paystack and Redis clients on shutdown.
+
+    Args:
+        app (FastAPI): FastAPI application instance
+
+    Yields:
+        None
+    """
+    yield
+    await close_paystack_client()
+    await close_redis_client()
+
+
+# Startup concerns, entered in order and exited in reverse
+_LIFESPANS = (_db_lifespan, _clients_lifespan)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage application lifespan - startup and shutdown events.
+
+    Enters every lifespan in _LIFESPANS in order and exits them in reverse
+    when the application shuts down.
     
-    logger.info(f"Shutting down {settings.APP_NAME}")
+    Args:
+        app (FastAPI): FastAPI application instance
+        
+    Yields:
+        None
+    """
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    logger.info("Environment: %s", settings.ENVIRONMENT)
+    async with AsyncExitStack() as stack:
+        for part in _LIFESPANS:
+            await stack.enter_async_context(part(app))
+
+        yield
+
+        logger.info("Shutting down %s", settings.APP_NAME)
 
 
 app = FastAPI(
@@ -51,64 +135,51 @@ app = FastAPI(
     description="Wallet Service API with Paystack Integration, JWT & API Keys",
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    docs_url=_DOCS_URL,
+    redoc_url=_REDOC_URL,
+    openapi_url=_OPENAPI_URL,
 )
 
+# Routes first, then middleware: the route table is complete before the
+# middleware stack is assembled (on the lifespan startup event, ahead of traffic)
+app.include_router(auth.router, prefix="/api/v1")
+app.include_router(keys.router, prefix="/api/v1")
+app.include_router(wallet.router, prefix="/api/v1")
+
+# Innermost: error responses still get CORS headers and compression
+app.add_middleware(WalletExceptionMiddleware)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[settings.FRONTEND_URL, settings.DEV_URL, settings.APP_URL],
+    FastCORSMiddleware,
+    allow_origins=_ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_CORS_METHODS,
+    allow_headers=_CORS_HEADERS,
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+app.add_middleware(RequestClockMiddleware)
+# Outermost: answers /health and / before any other middleware runs
+app.add_middleware(FastPathMiddleware, responses={"/health": _HEALTH, "/": _ROOT})
 
-app.add_exception_handler(WalletServiceException, wallet_service_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
 
-@app.get("/health", tags=["Health"])
-async def health_check():
-    """
-    Health check endpoint for service monitoring.
-    
-    Returns:
-        dict: Service status and version information
-    """
-    return {
-        "status": "healthy",
-        "app_name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-    }
-
-
-@app.get("/", tags=["Root"])
-async def root():
-    """
-    Root endpoint providing API information.
-    
-    Returns:
-        dict: API name and documentation links
-    """
-    return {
-        "message": f"Welcome to {settings.APP_NAME}",
-        "version": settings.APP_VERSION,
-        "docs": "/docs",
-        "redoc": "/redoc",
-    }
-
-app.include_router(auth.router, prefix="/api/v1")
-app.include_router(keys.router, prefix="/api/v1")
-app.include_router(wallet.router, prefix="/api/v1")
-
 if __name__ == "__main__":
     import uvicorn
 
-    logger.info(f"Starting server on 0.0.0.0:{settings.APP_PORT}")
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=settings.APP_PORT,
-        reload=settings.DEBUG,
-        reload_excludes=["logs/*", "*.log", "__pycache__/*", ".git/*"],
-        log_config=None,
-    )
+    logger.info("Starting server on 0.0.0.0:%s", settings.APP_PORT)
+    kwargs = {
+        "host": "0.0.0.0",
+        "port": settings.APP_PORT,
+        "log_config": None,
+        "http": "httptools",
+        # Per-request access lines are only worth their cost while developing
+        "access_log": settings.DEBUG,
+    }
+    if settings.DEBUG:
+        kwargs["reload"] = True
+        kwargs["reload_excludes"] = ["logs/*", "*.log", "__pycache__/*", ".git/*"]
+    else:
+        kwargs["loop"] = "uvloop"
+        kwargs["workers"] = settings.WORKERS
+    uvicorn.run("main:app", **kwargs)
@@ -2,6 +2,7 @@
 set -e
 
 APP_PORT=${APP_PORT:-8000}
+WORKERS=${WORKERS:-1}
 
 echo "Starting Wallet Service API on port $APP_PORT..."
 
@@ -15,9 +16,12 @@ if [ "$DEBUG" = "True" ]; then
         --reload-exclude "*.log" \
         --reload-exclude "__pycache__/*"
 else
-    echo "Running in PRODUCTION mode"
+    echo "Running in PRODUCTION mode with $WORKERS worker(s)"
     exec uvicorn main:app \
         --host 0.0.0.0 \
         --port "$APP_PORT" \
-        --workers 1
+        --loop uvloop \
+        --http httptools \
+        --no-access-log \
+        --workers "$WORKERS"
 fi